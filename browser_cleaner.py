@@ -4,26 +4,45 @@ Handles Chrome, Firefox, and Edge browser data cleaning.
 """
 
 import os
-import shutil
 import sqlite3
-from typing import List, Dict
+from stat import FILE_ATTRIBUTE_REPARSE_POINT
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+# Tables emptied for each SQLite-backed data type
+SQLITE_CLEAR_TABLES = {
+    'cookies': ['cookies'],
+    'history': ['urls', 'visits'],
+    'downloads': ['downloads'],
+}
+
+SQLITE_DELETE_BATCH_SIZE = 5000  # Rows per DELETE to bound statement memory
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024  # 256 MiB memory-mapped I/O window
 
 
 class BrowserCleaner:
     """Handles browser cache and data cleanup."""
     
     def __init__(self):
-        self.browsers = self._detect_browsers()
+        # Fresh dicts per instance; the shared cache only holds tuples
+        self.browsers = {name: dict(paths) for name, paths in self._detect_browsers()}
         self.cleaned_size = 0
         self.cleaned_files = 0
     
-    def _detect_browsers(self) -> Dict[str, Dict[str, str]]:
-        """Detect installed browsers and their data paths."""
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _detect_browsers(cls) -> Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]:
+        """Detect installed browsers and their data paths (cached per process).
+        
+        Returns immutable (browser, ((data_type, path), ...)) pairs so the
+        cached result cannot be changed through any instance.
+        """
         browsers = {}
         user_profile = os.environ.get('USERPROFILE', '')
         
         if not user_profile:
-            return browsers
+            return ()
         
         # Chrome paths
         chrome_paths = {
@@ -34,14 +53,32 @@ class BrowserCleaner:
             'temp': os.path.join(user_profile, 'AppData', 'Local', 'Google', 'Chrome', 'User Data', 'Default', 'Local Storage')
         }
         
-        if any(os.path.exists(path) for path in chrome_paths.values()):
+        # Edge paths
+        edge_paths = {
+            'cache': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Cache'),
+            'cookies': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Cookies'),
+            'history': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'History'),
+            'downloads': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'History'),
+            'temp': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Local Storage')
+        }
+        
+        firefox_base = os.path.join(user_profile, 'AppData', 'Roaming', 'Mozilla', 'Firefox', 'Profiles')
+        
+        # Fire all existence checks at once; on a cold disk each one is a seek
+        all_paths = list(chrome_paths.values()) + list(edge_paths.values()) + [firefox_base]
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            exists = list(executor.map(os.path.exists, all_paths))
+        chrome_count = len(chrome_paths)
+        edge_end = chrome_count + len(edge_paths)
+        
+        if any(exists[:chrome_count]):
             browsers['Chrome'] = chrome_paths
         
         # Firefox paths
-        firefox_base = os.path.join(user_profile, 'AppData', 'Roaming', 'Mozilla', 'Firefox', 'Profiles')
-        if os.path.exists(firefox_base):
+        if exists[-1]:
             try:
-                profiles = [d for d in os.listdir(firefox_base) if os.path.isdir(os.path.join(firefox_base, d))]
+                with os.scandir(firefox_base) as entries:
+                    profiles = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
                 if profiles:
                     profile_path = os.path.join(firefox_base, profiles[0])
                     firefox_paths = {
@@ -55,19 +92,10 @@ class BrowserCleaner:
             except (OSError, PermissionError):
                 pass
         
-        # Edge paths
-        edge_paths = {
-            'cache': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Cache'),
-            'cookies': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Cookies'),
-            'history': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'History'),
-            'downloads': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'History'),
-            'temp': os.path.join(user_profile, 'AppData', 'Local', 'Microsoft', 'Edge', 'User Data', 'Default', 'Local Storage')
-        }
-        
-        if any(os.path.exists(path) for path in edge_paths.values()):
+        if any(exists[chrome_count:edge_end]):
             browsers['Edge'] = edge_paths
         
-        return browsers
+        return tuple((name, tuple(paths.items())) for name, paths in browsers.items())
     
     def get_browser_data_size(self) -> Dict[str, Dict[str, float]]:
         """Get size of browser data for each detected browser."""
@@ -93,17 +121,30 @@ class BrowserCleaner:
         try:
             if os.path.isfile(path):
                 return os.path.getsize(path)
-            elif os.path.isdir(path):
-                for root, dirs, files in os.walk(path):
-                    for file in files:
+            elif not os.path.isdir(path):
+                return 0
+        except (OSError, PermissionError):
+            return 0
+        
+        # Iterative scandir walk; entry.stat() is served from the directory
+        # listing on Windows, so each file costs no extra syscall
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
                         try:
-                            file_path = os.path.join(root, file)
-                            if os.path.exists(file_path):
-                                total_size += os.path.getsize(file_path)
+                            if entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                            elif entry.is_dir(follow_symlinks=False):
+                                # Skip junctions and cloud placeholders (e.g. OneDrive)
+                                attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+                                if not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+                                    stack.append(entry.path)
                         except (OSError, PermissionError):
                             continue
-        except (OSError, PermissionError):
-            pass
+            except (OSError, PermissionError):
+                continue
         
         return total_size
     
@@ -159,63 +200,172 @@ class BrowserCleaner:
         }
     
     def _clear_sqlite_database(self, db_path: str, data_type: str):
-        """Clear specific tables in SQLite database."""
+        """Clear specific tables in SQLite database.
+        
+        All deletes run in a single transaction, so SQLite's own journal
+        restores the database if anything fails - no file copy is needed.
+        """
+        # Autocommit mode so the transaction boundaries below are explicit
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        cursor = conn.cursor()
+        original_journal_mode = None
         try:
-            # Create backup
-            backup_path = db_path + '.backup'
-            shutil.copy2(db_path, backup_path)
             
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
+            # WAL + NORMAL sync avoids writing every deleted page twice and
+            # fsyncing a full rollback journal
+            original_journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+            # Read pages straight from the OS page cache (bounded for 32-bit)
+            # and keep dirty pages in memory until commit
+            cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            cursor.execute("PRAGMA cache_spill=OFF")
             
-            if data_type == 'cookies':
-                cursor.execute("DELETE FROM cookies")
-            elif data_type == 'history':
-                cursor.execute("DELETE FROM urls")
-                cursor.execute("DELETE FROM visits")
-            elif data_type == 'downloads':
-                cursor.execute("DELETE FROM downloads")
+            # Foreign key checks would disable SQLite's truncate optimization
+            cursor.execute("PRAGMA foreign_keys=OFF")
             
-            conn.commit()
-            conn.close()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                for table in SQLITE_CLEAR_TABLES.get(data_type, []):
+                    self._purge_table(conn, table)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
             
-            # Remove backup if successful
-            if os.path.exists(backup_path):
-                os.remove(backup_path)
-                
-        except Exception as e:
-            # Restore backup if something went wrong
-            if os.path.exists(backup_path):
-                shutil.move(backup_path, db_path)
-            raise e
+            # Refresh planner stats; freed pages stay on the free list for reuse
+            cursor.execute("PRAGMA optimize")
+        finally:
+            # Leave the browser's database in the journal mode it expects,
+            # even when the purge failed and was rolled back
+            if original_journal_mode is not None:
+                try:
+                    cursor.execute(f"PRAGMA journal_mode={original_journal_mode}")
+                except sqlite3.Error:
+                    pass
+            conn.close()
+    
+    def _purge_table(self, conn: sqlite3.Connection, table: str):
+        """Empty a table, using SQLite's truncate optimization when possible."""
+        has_triggers = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ? LIMIT 1",
+            (table,)
+        ).fetchone()
+        
+        if has_triggers:
+            # Triggers must fire per row, so keep the bounded batches
+            self._delete_in_batches(conn, table)
+        else:
+            # An unqualified DELETE drops the table's pages in O(1) instead
+            # of journaling every row
+            conn.execute(f"DELETE FROM {table}")
+    
+    def _delete_in_batches(self, conn: sqlite3.Connection, table: str):
+        """Delete all rows of a table in bounded batches."""
+        while True:
+            cursor = conn.execute(
+                f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} LIMIT ?)",
+                (SQLITE_DELETE_BATCH_SIZE,)
+            )
+            if cursor.rowcount == 0:
+                break
     
     def _clean_directory_browser(self, directory: str, errors: List[str]):
-        """Clean files in a browser directory."""
+        """Clean files in a browser directory.
+        
+        Browser caches fan out into many subdirectories, so each top-level
+        subdirectory is cleaned on a worker thread to keep several deletes
+        in flight.
+        """
         try:
-            for root, dirs, files in os.walk(directory, topdown=False):
-                for file in files:
+            subdirs = []
+            with os.scandir(directory) as entries:
+                for entry in entries:
                     try:
-                        file_path = os.path.join(root, file)
-                        if os.path.exists(file_path):
-                            file_size = os.path.getsize(file_path)
-                            os.remove(file_path)
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        else:
+                            file_size = entry.stat(follow_symlinks=False).st_size
+                            os.remove(entry.path)
                             self.cleaned_size += file_size
                             self.cleaned_files += 1
                     except (OSError, PermissionError) as e:
-                        errors.append(f"Cannot delete {file_path}: {str(e)}")
-                        continue
-                
-                # Remove empty directories
-                for dir_name in dirs:
-                    try:
-                        dir_path = os.path.join(root, dir_name)
-                        if os.path.exists(dir_path) and not os.listdir(dir_path):
-                            os.rmdir(dir_path)
-                    except (OSError, PermissionError):
-                        continue
+                        errors.append(f"Cannot delete {entry.path}: {str(e)}")
+            
+            if len(subdirs) > 1:
+                max_workers = min(8, (os.cpu_count() or 1) * 2)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(lambda path: self._clean_subdirectory(path, errors), subdirs))
+            else:
+                results = [self._clean_subdirectory(path, errors) for path in subdirs]
+            
+            # Per-worker totals are summed here instead of sharing counters
+            for size, files in results:
+                self.cleaned_size += size
+                self.cleaned_files += files
         except Exception as e:
             errors.append(f"Error accessing {directory}: {str(e)}")
     
+    def _clean_subdirectory(self, directory: str, errors: List[str]) -> Tuple[int, int]:
+        """Clean a subdirectory tree and remove it if it ends up empty."""
+        try:
+            result = self._clean_tree(directory, errors)
+        except (OSError, PermissionError) as e:
+            errors.append(f"Error accessing {directory}: {str(e)}")
+            return 0, 0
+        
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass  # Not empty or in use
+        return result
+    
+    def _clean_tree(self, directory: str, errors: List[str]) -> Tuple[int, int]:
+        """Delete files below a directory, removing emptied subdirectories.
+        
+        Sizes come from the scandir entries (filled in by the directory
+        listing on Windows) instead of an exists/getsize pair per file. The
+        top-level directory itself is kept. Returns (bytes, files) deleted.
+        """
+        cleaned_size = 0
+        cleaned_files = 0
+        
+        # Each frame: (directory path, scandir iterator)
+        stack = [(directory, os.scandir(directory))]
+        try:
+            while stack:
+                dir_path, entries = stack[-1]
+                entry = next(entries, None)
+                
+                if entry is None:
+                    entries.close()
+                    stack.pop()
+                    if stack:
+                        try:
+                            os.rmdir(dir_path)
+                        except OSError:
+                            pass  # Not empty or in use
+                    continue
+                
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, os.scandir(entry.path)))
+                    else:
+                        file_size = entry.stat(follow_symlinks=False).st_size
+                        os.remove(entry.path)
+                        cleaned_size += file_size
+                        cleaned_files += 1
+                except (OSError, PermissionError) as e:
+                    errors.append(f"Cannot delete {entry.path}: {str(e)}")
+        finally:
+            # Only reached with frames left if an unexpected error escaped
+            for _, entries in stack:
+                entries.close()
+        
+        return cleaned_size, cleaned_files
+    
     def clean_all_browsers(self, data_types: List[str]) -> Dict[str, any]:
         """Clean specified data types from all detected browsers."""
         results = []
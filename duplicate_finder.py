@@ -1,44 +1,88 @@
 """
 Duplicate File Finder module for PC Maintenance Dashboard.
-Finds and manages duplicate files using MD5 hashing.
+Finds and manages duplicate files using xxHash3 or BLAKE3 (when available)
+or MD5 hashing.
 """
 
 import os
 import hashlib
+import filecmp
+import mmap
 import time
-from pathlib import Path
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple, Set
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+try:
+    import xxhash
+except ImportError:
+    # Optional dependency - fall back to BLAKE3 or MD5
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    # Optional dependency - fall back to hashlib MD5
+    blake3 = None
+
+HEAD_HASH_SIZE = 64 * 1024  # Bytes read by the cheap pre-filter hash
+PARALLEL_HASH_THRESHOLD = 32  # Below this, thread pool overhead outweighs the gain
+
+# System directories that are never descended into
+SKIP_DIRS = frozenset([
+    'system volume information', '$recycle.bin', 'windows', 'program files',
+    'program files (x86)', 'appdata\\local\\temp', 'temp'
+])
 
 
 class DuplicateFinder:
     """Handles duplicate file detection and management."""
     
     def __init__(self):
-        self.file_hashes = defaultdict(list)
+        # Hashed files are stored column-wise instead of one dict per file
+        self.paths = []
+        self.sizes = array('Q')
+        self.hashes = []
         self.scanned_files = 0
         self.total_files = 0
         self.duplicates_found = {}
         self.total_duplicate_size = 0
         
-    def calculate_file_hash(self, file_path: str) -> str:
-        """Calculate MD5 hash of a file with size limit."""
-        hash_md5 = hashlib.md5()
+    def calculate_file_hash(self, file_path: str) -> bytes:
+        """Calculate the content digest of a file with size limit.
+        
+        Prefers xxHash3-128 (non-cryptographic, so files are compared
+        byte-by-byte right before deletion), then BLAKE3, then MD5.
+        """
         max_file_size = 100 * 1024 * 1024  # 100MB limit to prevent hanging
         
+        if xxhash is not None:
+            file_hash = xxhash.xxh3_128()
+        elif blake3 is not None:
+            file_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            file_hash = hashlib.md5()
+        
         try:
-            file_size = os.path.getsize(file_path)
-            if file_size > max_file_size:
-                return None  # Skip very large files
-                
             with open(file_path, "rb") as f:
-                bytes_read = 0
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-                    bytes_read += len(chunk)
-                    if bytes_read > max_file_size:  # Double check during reading
+                if os.fstat(f.fileno()).st_size > max_file_size:
+                    return None  # Skip very large files
+                try:
+                    view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    return file_hash.digest()  # Empty files cannot be mapped
+                with view:
+                    # The mapping is sized when it is created, so the length
+                    # check below also bounds a file that grew after the stat
+                    if len(view) > max_file_size:
                         return None
-            return hash_md5.hexdigest()
+                    # One call over the whole mapping; the hash runs in native
+                    # code without the GIL (and with SIMD threads for BLAKE3)
+                    file_hash.update(view)
+            return file_hash.digest()
         except (OSError, PermissionError):
             return None
     
@@ -50,63 +94,162 @@ class DuplicateFinder:
                 'path': file_path,
                 'size': stat.st_size,
                 'modified': time.ctime(stat.st_mtime),
-                'accessed': time.ctime(stat.st_atime),
-                'created': time.ctime(stat.st_ctime),
+                'mtime_raw': stat.st_mtime,
                 'size_mb': stat.st_size / (1024**2)
             }
         except (OSError, PermissionError):
             return None
     
+    def _clear_files(self):
+        """Reset the per-file columns."""
+        self.paths.clear()
+        self.sizes = array('Q')
+        self.hashes.clear()
+    
+    def _push_file(self, file_path: str, file_hash: bytes, size: int):
+        """Append a hashed file to the columns."""
+        self.hashes.append(file_hash)
+        self.paths.append(file_path)
+        self.sizes.append(size)
+    
+    def _iter_files(self, directory: str, skip_dirs: Set[str] = SKIP_DIRS):
+        """Yield DirEntry objects for regular, non-hidden files under directory.
+        
+        Uses an explicit stack of os.scandir iterators so that the stat data
+        gathered during enumeration can be reused by the caller.
+        """
+        stack = [directory]
+        push = stack.append
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name[0] == '.':
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if name.lower() not in skip_dirs:
+                                    push(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+    
+    @staticmethod
+    def _normalize_extensions(extensions: Set[str]) -> frozenset:
+        """Lowercase extensions and strip their leading dots for set lookups."""
+        return frozenset(ext.lower().lstrip('.') for ext in extensions)
+    
+    def _matches_extension(self, name: str, extensions: Set[str]) -> bool:
+        """Check a file name against a set of normalized extensions."""
+        dot = name.rfind('.')
+        return dot >= 0 and name[dot + 1:].lower() in extensions
+    
     def count_files_in_directory(self, directory: str, extensions: Set[str] = None, 
                                 min_size: int = 0) -> int:
         """Count total files to be scanned."""
         count = 0
         max_files = 10000  # Limit to prevent infinite scanning
+        if extensions:
+            extensions = self._normalize_extensions(extensions)
         
+        for entry in self._iter_files(directory):
+            if count >= max_files:  # Prevent excessive scanning
+                return max_files
+            
+            if extensions and not self._matches_extension(entry.name, extensions):
+                continue
+            
+            try:
+                if entry.stat(follow_symlinks=False).st_size < min_size:
+                    continue
+            except OSError:
+                continue
+            
+            count += 1
+        
+        return count
+    
+    def calculate_head_hash(self, file_path: str) -> bytes:
+        """Calculate a cheap digest of the first HEAD_HASH_SIZE bytes of a file."""
         try:
-            for root, dirs, files in os.walk(directory):
-                # Skip system directories and limit depth
-                dirs[:] = [d for d in dirs if not d.startswith('.') and 
-                          d.lower() not in ['system volume information', '$recycle.bin', 
-                                          'windows', 'program files', 'program files (x86)',
-                                          'appdata\\local\\temp', 'temp']]
-                
-                for file in files:
-                    if count >= max_files:  # Prevent excessive scanning
-                        return max_files
-                        
-                    if file.startswith('.'):
-                        continue
-                        
-                    file_path = os.path.join(root, file)
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        if file_size < min_size:
-                            continue
-                            
-                        if extensions:
-                            file_ext = Path(file_path).suffix.lower()
-                            if file_ext not in extensions:
-                                continue
-                        
-                        count += 1
-                    except (OSError, PermissionError):
-                        continue
+            with open(file_path, "rb") as f:
+                head = f.read(HEAD_HASH_SIZE)
+            if xxhash is not None:
+                return xxhash.xxh3_64_digest(head)
+            return hashlib.blake2b(head, digest_size=16).digest()
         except (OSError, PermissionError):
-            pass
+            return None
+    
+    def _hash_files(self, candidates: List[Tuple[int, str]], hash_func):
+        """Yield (size, path, hash_func(path)) for each candidate file.
         
-        return count
+        Hashing releases the GIL while reading, so larger batches are spread
+        over a thread pool to keep the disk queue busy.
+        """
+        if len(candidates) < PARALLEL_HASH_THRESHOLD:
+            for size, file_path in candidates:
+                yield size, file_path, hash_func(file_path)
+            return
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            futures = {
+                executor.submit(hash_func, file_path): (size, file_path)
+                for size, file_path in candidates
+            }
+            for future in as_completed(futures):
+                size, file_path = futures[future]
+                yield size, file_path, future.result()
     
     def scan_directory(self, directory: str, extensions: Set[str] = None, 
-                      min_size: int = 1024, progress_callback=None) -> Dict[str, List[Dict]]:
-        """Scan directory for duplicate files."""
-        self.file_hashes.clear()
+                      min_size: int = 1024, progress_callback=None) -> Dict[bytes, List[Dict]]:
+        """Scan directory for duplicate files.
+        
+        Runs in three passes so that only plausible duplicates are fully read:
+        group candidates by size, then by a digest of the first 64 KiB, and
+        only full-hash the files that share both.
+        """
+        self._clear_files()
         self.scanned_files = 0
         self.duplicates_found.clear()
         self.total_duplicate_size = 0
         
-        # Count total files first (with limit)
-        self.total_files = self.count_files_in_directory(directory, extensions, min_size)
+        max_scan_files = 10000  # Limit scanning to prevent freezing
+        
+        # Pass 1: collect candidate files grouped by size
+        if extensions:
+            extensions = self._normalize_extensions(extensions)
+        
+        # Hot loop: keep the counter and callables in locals to avoid
+        # attribute lookups per file
+        size_groups = defaultdict(list)
+        scanned = 0
+        for entry in self._iter_files(directory):
+            if scanned >= max_scan_files:  # Prevent excessive scanning
+                break
+            
+            if extensions:
+                # Inlined extension check: no Path or helper call per file
+                name = entry.name
+                dot = name.rfind('.')
+                if dot < 0 or name[dot + 1:].lower() not in extensions:
+                    continue
+            
+            try:
+                file_size = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+            if file_size < min_size:
+                continue
+            
+            size_groups[file_size].append(entry.path)
+            scanned += 1
+        
+        self.scanned_files = scanned
+        self.total_files = scanned
         
         # Debug logging for file type filtering
         if extensions:
@@ -117,71 +260,70 @@ class DuplicateFinder:
             print(f"No files found matching criteria in {directory}")
             return {}
         
-        max_scan_files = 10000  # Limit scanning to prevent freezing
+        # Files with a unique size cannot have a duplicate
+        size_groups = {size: paths for size, paths in size_groups.items() if len(paths) > 1}
         
-        # Scan files and calculate hashes
-        try:
-            for root, dirs, files in os.walk(directory):
-                # Skip system directories and limit depth
-                dirs[:] = [d for d in dirs if not d.startswith('.') and 
-                          d.lower() not in ['system volume information', '$recycle.bin',
-                                          'windows', 'program files', 'program files (x86)',
-                                          'appdata\\local\\temp', 'temp']]
-                
-                for file in files:
-                    if self.scanned_files >= max_scan_files:  # Prevent excessive scanning
-                        break
-                        
-                    if file.startswith('.'):
-                        continue
-                        
-                    file_path = os.path.join(root, file)
-                    
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        if file_size < min_size:
-                            continue
-                            
-                        if extensions:
-                            file_ext = Path(file_path).suffix.lower()
-                            if file_ext not in extensions:
-                                continue
-                        
-                        # Calculate hash
-                        file_hash = self.calculate_file_hash(file_path)
-                        if file_hash:
-                            file_info = self.get_file_info(file_path)
-                            if file_info:
-                                self.file_hashes[file_hash].append(file_info)
-                        
-                        self.scanned_files += 1
-                        
-                        # Update progress more frequently
-                        if progress_callback and self.scanned_files % 5 == 0:
-                            progress = min(int((self.scanned_files / min(self.total_files, max_scan_files)) * 100), 100)
-                            progress_callback(progress, file_path)
-                            
-                    except (OSError, PermissionError):
-                        continue
-                
-                # Break outer loop if limit reached
-                if self.scanned_files >= max_scan_files:
-                    break
-                        
-        except (OSError, PermissionError):
-            pass
+        # Progress is weighted by the bytes each remaining pass has to read
+        head_budget = sum(min(size, HEAD_HASH_SIZE) * len(paths) for size, paths in size_groups.items())
+        full_budget = sum(size * len(paths) for size, paths in size_groups.items())
+        bytes_done = 0
+        
+        def report(file_path):
+            if progress_callback:
+                total_budget = head_budget + full_budget
+                progress = int(bytes_done / total_budget * 100) if total_budget else 100
+                progress_callback(min(progress, 100), file_path)
+        
+        # Pass 2: group same-size files by a digest of their first bytes
+        head_groups = defaultdict(list)
+        processed = 0
+        candidates = [(size, file_path) for size, paths in size_groups.items() for file_path in paths]
+        for size, file_path, head_hash in self._hash_files(candidates, self.calculate_head_hash):
+            if head_hash:
+                head_groups[(size, head_hash)].append(file_path)
+            bytes_done += min(size, HEAD_HASH_SIZE)
+            processed += 1
+            if processed % 5 == 0:
+                report(file_path)
+        
+        survivors = [(size, paths) for (size, _), paths in head_groups.items() if len(paths) > 1]
+        
+        # Rescale the remaining budget to the files that survived the head pass
+        full_budget = sum(size * len(paths) for size, paths in survivors)
+        head_budget = bytes_done
+        
+        # Pass 3: full hash only for files sharing both size and head digest
+        candidates = [(size, file_path) for size, paths in survivors for file_path in paths]
+        for size, file_path, file_hash in self._hash_files(candidates, self.calculate_file_hash):
+            if file_hash:
+                # Size comes from scandir; full file info is only built for groups
+                self._push_file(file_path, file_hash, size)
+            bytes_done += size
+            processed += 1
+            if processed % 5 == 0:
+                report(file_path)
         
         # Find duplicates
         duplicates = {}
-        for file_hash, files in self.file_hashes.items():
-            if len(files) > 1:
-                # Sort by modification time (newest first)
-                files.sort(key=lambda x: os.path.getmtime(x['path']), reverse=True)
-                duplicates[file_hash] = files
-                
-                # Calculate duplicate size (all but the first file)
-                for file_info in files[1:]:
-                    self.total_duplicate_size += file_info['size']
+        paths = self.paths
+        sizes = self.sizes
+        # Group equal digests with one sort instead of a dict of lists; most
+        # digests are unique and never need a list of their own
+        hashes = self.hashes
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        for file_hash, group in groupby(order, key=hashes.__getitem__):
+            idxs = list(group)
+            if len(idxs) > 1:
+                # Only files that are part of a group are turned into dicts
+                files = [self.get_file_info(paths[idx]) for idx in idxs]
+                files = [file_info for file_info in files if file_info]
+                if len(files) > 1:
+                    # Sort by modification time (newest first)
+                    files.sort(key=itemgetter('mtime_raw'), reverse=True)
+                    duplicates[file_hash] = files
+                    
+                    # Every copy has the same size; all but the first are savings
+                    self.total_duplicate_size += sizes[idxs[0]] * (len(files) - 1)
         
         self.duplicates_found = duplicates
         return duplicates
@@ -209,13 +351,41 @@ class DuplicateFinder:
             'scanned_files': self.scanned_files
         }
     
+    @staticmethod
+    def _same_content(path_a: str, path_b: str) -> bool:
+        """Return True if both files are byte-identical; unreadable files never match."""
+        try:
+            return filecmp.cmp(path_a, path_b, shallow=False)
+        except (OSError, PermissionError):
+            return False
+    
+    def _kept_copies(self, selected: Set[str]) -> Dict[str, List[str]]:
+        """Map each selected file to the members of its group that stay on disk."""
+        kept = {}
+        for files in self.duplicates_found.values():
+            group_paths = [file_info['path'] for file_info in files]
+            survivors = [path for path in group_paths if path not in selected]
+            for path in group_paths:
+                if path in selected:
+                    kept[path] = survivors
+        return kept
+    
     def delete_selected_duplicates(self, selected_files: List[str]) -> Dict[str, any]:
-        """Delete selected duplicate files."""
+        """Delete selected duplicate files.
+        
+        With xxHash digests a file is only deleted once it has been confirmed
+        byte-identical to a copy that is kept.
+        """
         deleted_files = 0
         deleted_size = 0
         errors = []
+        kept = self._kept_copies(set(selected_files)) if xxhash is not None else None
         
         for file_path in selected_files:
+            if kept is not None and not any(
+                    self._same_content(file_path, other) for other in kept.get(file_path, ())):
+                errors.append(f"Skipped {file_path}: no identical copy is kept")
+                continue
             try:
                 if os.path.exists(file_path):
                     file_size = os.path.getsize(file_path)
@@ -2,8 +2,12 @@
 Thread class for duplicate file scanning to keep UI responsive.
 """
 
+import time
+
 from PyQt5.QtCore import QThread, pyqtSignal
 
+PROGRESS_EMIT_INTERVAL = 0.1  # Seconds between cross-thread progress signals
+
 
 class DuplicateScanThread(QThread):
     """Worker thread for duplicate file scanning."""
@@ -17,11 +21,16 @@ class DuplicateScanThread(QThread):
         self.scan_path = scan_path
         self.extensions = extensions
         self.min_size = min_size
+        self._last_emit = 0.0
     
     def run(self):
         """Run the duplicate scan in background thread."""
         def progress_callback(progress, current_file):
-            self.progress_updated.emit(progress, current_file)
+            # Coalesce updates: one signal per interval, but always report completion
+            now = time.monotonic()
+            if progress >= 100 or now - self._last_emit > PROGRESS_EMIT_INTERVAL:
+                self.progress_updated.emit(progress, current_file)
+                self._last_emit = now
         
         duplicates = self.duplicate_finder.scan_directory(
             self.scan_path, 
@@ -31,3 +40,19 @@ class DuplicateScanThread(QThread):
         )
         
         self.scan_completed.emit(duplicates)
+
+
+class DuplicateDeleteThread(QThread):
+    """Worker thread that verifies and deletes the selected duplicates."""
+    
+    deletion_completed = pyqtSignal(list, dict)  # selected files, deletion result
+    
+    def __init__(self, duplicate_finder, selected_files):
+        super().__init__()
+        self.duplicate_finder = duplicate_finder
+        self.selected_files = selected_files
+    
+    def run(self):
+        """Delete in the background; byte comparisons can re-read large files."""
+        result = self.duplicate_finder.delete_selected_duplicates(self.selected_files)
+        self.deletion_completed.emit(self.selected_files, result)
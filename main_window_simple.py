@@ -4,6 +4,9 @@ Simple main window for PC Maintenance Dashboard - Basic PyQt5 styling.
 
 import sys
 import os
+import shutil
+import subprocess
+import tempfile
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -15,7 +18,200 @@ from startup_window import StartupWindow
 from system_tray import SystemTrayManager
 from scheduler import MaintenanceScheduler, SchedulerDialog
 from collections import deque
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from operator import itemgetter
+import ctypes
+import gc
+import heapq
+import platform
+import re
 import time
+import webbrowser
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _require_psutil():
+    """Raise ImportError if psutil is missing, for handlers that report it to the user."""
+    if psutil is None:
+        raise ImportError("psutil is not installed")
+
+
+_PARTITIONS_TTL = 30  # Seconds; mounted volumes rarely change
+_partitions_cache = (None, [])
+
+
+def _get_partitions():
+    """Return fixed-disk partitions (no CD-ROMs), re-enumerated at most every 30 s."""
+    global _partitions_cache
+    timestamp, partitions = _partitions_cache
+    now = time.monotonic()
+    if timestamp is None or now - timestamp > _PARTITIONS_TTL:
+        partitions = [p for p in psutil.disk_partitions(all=False) if 'cdrom' not in p.opts and p.fstype]
+        _partitions_cache = (now, partitions)
+    return partitions
+
+
+def _safe_disk_usage(mountpoint):
+    """Return psutil.disk_usage for mountpoint, or None if it cannot be read."""
+    try:
+        return psutil.disk_usage(mountpoint)
+    except (PermissionError, FileNotFoundError):
+        return None
+
+
+def _partition_usages(partitions):
+    """Return (partition, usage or None) pairs, querying the volumes concurrently.
+    
+    A slow volume (network share, sleeping disk) then costs its own latency
+    once instead of delaying every drive after it.
+    """
+    if not partitions:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(partitions))) as executor:
+        return list(zip(partitions, executor.map(_safe_disk_usage, [p.mountpoint for p in partitions])))
+
+# Fixed graph colors, parsed once at import
+_BG_COLOR = QColor("#f8f9fa")
+_FG_COLOR = QColor("#212529")
+_LABEL_COLOR = QColor("#6c757d")
+_GRID_COLOR = QColor("#e9ecef")
+
+# Activity log severities, compared as integers when filtering
+LOG_DEBUG, LOG_INFO, LOG_WARNING, LOG_ERROR, LOG_CRITICAL = range(5)
+LOG_FILTER_MIN_LEVEL = {"All": LOG_DEBUG, "Errors Only": LOG_ERROR, "Warnings+": LOG_WARNING, "Info+": LOG_INFO}
+
+# Well-known service ports called out by the security scan
+COMMON_PORTS = frozenset({80, 443, 22, 21, 25, 53, 110, 143, 993, 995})
+
+# (severity, color, icon) for each log_activity level name
+LOG_LEVEL_FORMAT = {
+    "ERROR": (LOG_ERROR, '#e74c3c', "❌"),
+    "WARNING": (LOG_WARNING, '#f39c12', "⚠️"),
+    "SUCCESS": (LOG_INFO, '#27ae60', "✅"),
+    "CRITICAL": (LOG_CRITICAL, '#c0392b', "🚨"),
+    "INFO": (LOG_INFO, '#2c3e50', "ℹ️"),
+}
+
+
+def _iter_file_entries(root):
+    """Yield a DirEntry for every regular file under root.
+    
+    Walks with os.scandir and an explicit stack; file types come from the
+    directory listing, so no extra syscall is made per file.
+    """
+    stack = deque([root])
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except (PermissionError, OSError):
+                        continue
+        except (PermissionError, OSError):
+            continue
+
+
+def _iter_files(root):
+    """Yield (path, size) for every regular file under root."""
+    for entry in _iter_file_entries(root):
+        try:
+            yield entry.path, entry.stat(follow_symlinks=False).st_size
+        except (PermissionError, OSError):
+            continue
+
+
+def _remove_entry(entry):
+    """Delete the file behind a DirEntry and return its size.
+    
+    On Windows the size is read after the delete from the stat cached in the
+    directory listing, so locked files that fail to delete cost no stat.
+    POSIX has no cached stat, so there the size must be read first.
+    """
+    if os.name == 'nt':
+        os.remove(entry.path)
+        return entry.stat(follow_symlinks=False).st_size
+    size = entry.stat(follow_symlinks=False).st_size
+    os.remove(entry.path)
+    return size
+
+
+def _unique_dirs(paths):
+    """Return the existing directories in paths, each physical one only once.
+    
+    Aliases such as %TEMP%, %TMP% and %LOCALAPPDATA%\\Temp usually resolve to
+    the same directory; walking it once avoids double stats and deletes.
+    """
+    seen = set()
+    unique = []
+    for path in paths:
+        real_path = os.path.realpath(os.path.expandvars(path))
+        key = os.path.normcase(real_path)
+        if key in seen or not os.path.isdir(real_path):
+            continue
+        seen.add(key)
+        unique.append(real_path)
+    return unique
+
+
+_DIR_SIZE_MAX_FILES = 1000  # Per-folder file cap for disk analysis estimates
+_DIR_SIZE_CAP = 5 * 1024**3  # Stop sizing a folder once it is known to exceed 5 GB
+_DIR_SIZE_TOP = 20  # Folders listed in the disk analysis report
+
+# System directories that cause issues when sized
+_DIR_SIZE_SKIP = ('system volume information', '$recycle.bin',
+                  'windows\\winsxs', 'pagefile.sys', 'hiberfil.sys')
+_DIR_SIZE_SKIP_RE = re.compile('|'.join(map(re.escape, _DIR_SIZE_SKIP)), re.IGNORECASE)
+
+
+def _dir_size(item_path, max_files=_DIR_SIZE_MAX_FILES):
+    """Estimate a folder's size from a capped, two-level-deep sample.
+    
+    Sizes come from DirEntry.stat, which Windows fills from the directory
+    listing, so no second syscall is made per file. Returns
+    (size, file_count); file_count reaching max_files or size passing
+    _DIR_SIZE_CAP means the scan stopped early and the size is an
+    underestimate.
+    """
+    size = 0
+    file_count = 0
+    stack = deque([(item_path, 0)])
+    
+    while stack and file_count < max_files:
+        path, depth = stack.pop()
+        if _DIR_SIZE_SKIP_RE.search(path):
+            continue
+        
+        dir_files = 0  # Limit files per directory
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Only go 2 levels deep to prevent hanging
+                            if depth < 2:
+                                stack.append((entry.path, depth + 1))
+                        elif dir_files < 50 and file_count < max_files:
+                            size += entry.stat(follow_symlinks=False).st_size
+                            dir_files += 1
+                            file_count += 1
+                            if size > _DIR_SIZE_CAP:
+                                return size, file_count
+                    except (PermissionError, OSError):
+                        continue
+        except (PermissionError, OSError):
+            continue
+    
+    return size, file_count
 
 
 class CleanupWorker(QThread):
@@ -28,15 +224,82 @@ class CleanupWorker(QThread):
         super().__init__()
         self.cleanup = FileCleanup()
     
+    @staticmethod
+    def _clean_temp_root(temp_dir):
+        """Delete every file under a temp root.
+        
+        Returns (files_found, files_cleaned, bytes_freed).
+        """
+        files_found = files_cleaned = bytes_freed = 0
+        for entry in _iter_file_entries(temp_dir):
+            files_found += 1
+            try:
+                bytes_freed += _remove_entry(entry)
+                files_cleaned += 1
+            except (PermissionError, FileNotFoundError, OSError):
+                continue
+        return files_found, files_cleaned, bytes_freed
+    
+    @staticmethod
+    def _clean_firefox_profiles(profiles_dir):
+        """Remove the cache2 tree of every Firefox profile."""
+        files_found = files_cleaned = bytes_freed = 0
+        with os.scandir(profiles_dir) as it:
+            profiles = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+        
+        for profile_path in profiles:
+            profile_cache = os.path.join(profile_path, 'cache2')
+            if not os.path.isdir(profile_cache):
+                continue
+            
+            # Estimate Firefox cache size (the walk never raises), then drop the whole tree
+            cache_size = 0
+            for _, size in _iter_files(profile_cache):
+                cache_size += size
+            files_found += 1
+            try:
+                shutil.rmtree(profile_cache)
+            except (PermissionError, OSError):
+                continue
+            files_cleaned += 1
+            bytes_freed += cache_size
+        return files_found, files_cleaned, bytes_freed
+    
+    @staticmethod
+    def _clean_browser_cache(cache_dir):
+        """Delete up to 100 top-level files from a Chrome/Edge cache."""
+        files_found = files_cleaned = bytes_freed = 0
+        with os.scandir(cache_dir) as it:
+            # islice stops reading the directory after 100 entries
+            for entry in islice(it, 100):  # Limit to avoid long delays
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                files_found += 1
+                try:
+                    bytes_freed += _remove_entry(entry)
+                    files_cleaned += 1
+                except (PermissionError, FileNotFoundError, OSError):
+                    continue
+        return files_found, files_cleaned, bytes_freed
+    
+    @staticmethod
+    def _clean_prefetch(prefetch_dir):
+        """Delete Windows prefetch (.pf) files."""
+        files_found = files_cleaned = bytes_freed = 0
+        with os.scandir(prefetch_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.pf') and entry.is_file(follow_symlinks=False):
+                    files_found += 1
+                    try:
+                        bytes_freed += _remove_entry(entry)
+                        files_cleaned += 1
+                    except (PermissionError, FileNotFoundError, OSError):
+                        continue
+        return files_found, files_cleaned, bytes_freed
+    
     def run(self):
-        """Run the cleanup process with scan-first approach."""
+        """Run the cleanup process, deleting files as they are scanned."""
         try:
-            import os
-            import tempfile
-            import shutil
-            from pathlib import Path
-            
-            # First, scan for files to delete without actually deleting
             self.progress.emit(10)
             
             # Define temp directories to clean
@@ -56,88 +319,47 @@ class CleanupWorker(QThread):
                 os.path.expandvars(r'%APPDATA%\Mozilla\Firefox\Profiles'),
             ]
             
-            files_to_delete = []
-            total_size_to_free = 0
-            
-            self.progress.emit(20)
-            
-            # Scan temp directories for files to delete
-            for temp_dir in temp_dirs:
-                if os.path.exists(temp_dir):
-                    try:
-                        for root, dirs, files in os.walk(temp_dir):
-                            for file in files:
-                                try:
-                                    file_path = os.path.join(root, file)
-                                    if os.path.exists(file_path):
-                                        file_size = os.path.getsize(file_path)
-                                        files_to_delete.append((file_path, file_size))
-                                        total_size_to_free += file_size
-                                except (PermissionError, FileNotFoundError, OSError):
-                                    continue
-                    except (PermissionError, OSError):
-                        continue
-            
-            self.progress.emit(40)
+            # Every root is walked and cleaned on its own thread; the work is
+            # syscall-bound, so the GIL is not the bottleneck
+            tasks = [(self._clean_temp_root, d) for d in _unique_dirs(temp_dirs)]
+            for cache_dir in _unique_dirs(browser_cache_dirs):
+                if 'Firefox' in cache_dir:
+                    tasks.append((self._clean_firefox_profiles, cache_dir))
+                else:
+                    tasks.append((self._clean_browser_cache, cache_dir))
+            prefetch_dir = os.path.expandvars(r'%WINDIR%\Prefetch')
+            if os.path.exists(prefetch_dir):
+                tasks.append((self._clean_prefetch, prefetch_dir))
             
-            # Scan browser caches
-            for cache_dir in browser_cache_dirs:
-                if os.path.exists(cache_dir):
-                    try:
-                        if 'Firefox' in cache_dir:
-                            # Handle Firefox profiles
-                            for profile in os.listdir(cache_dir):
-                                profile_cache = os.path.join(cache_dir, profile, 'cache2')
-                                if os.path.exists(profile_cache):
-                                    try:
-                                        # Estimate Firefox cache size
-                                        cache_size = sum(os.path.getsize(os.path.join(dirpath, filename))
-                                                       for dirpath, dirnames, filenames in os.walk(profile_cache)
-                                                       for filename in filenames)
-                                        files_to_delete.append((profile_cache, cache_size))
-                                        total_size_to_free += cache_size
-                                    except (PermissionError, OSError):
-                                        continue
-                        else:
-                            # Handle Chrome/Edge cache
-                            try:
-                                cache_files = os.listdir(cache_dir)
-                                for cache_file in cache_files[:100]:  # Limit to avoid long delays
-                                    cache_path = os.path.join(cache_dir, cache_file)
-                                    if os.path.isfile(cache_path):
-                                        try:
-                                            file_size = os.path.getsize(cache_path)
-                                            files_to_delete.append((cache_path, file_size))
-                                            total_size_to_free += file_size
-                                        except (PermissionError, FileNotFoundError, OSError):
-                                            continue
-                            except (PermissionError, OSError):
-                                continue
-                    except (PermissionError, OSError):
-                        continue
+            files_found = 0
+            files_cleaned = 0
+            space_freed = 0
             
-            self.progress.emit(50)
+            self.progress.emit(20)
             
-            # Scan Windows prefetch files
-            prefetch_dir = os.path.expandvars(r'%WINDIR%\Prefetch')
-            if os.path.exists(prefetch_dir):
-                try:
-                    for file in os.listdir(prefetch_dir):
-                        if file.endswith('.pf'):
-                            try:
-                                file_path = os.path.join(prefetch_dir, file)
-                                file_size = os.path.getsize(file_path)
-                                files_to_delete.append((file_path, file_size))
-                                total_size_to_free += file_size
-                            except (PermissionError, FileNotFoundError, OSError):
-                                continue
-                except (PermissionError, OSError):
-                    pass
+            if tasks:
+                with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                    futures = [executor.submit(func, path) for func, path in tasks]
+                    last_progress = 20
+                    for done, future in enumerate(as_completed(futures), 1):
+                        try:
+                            found, cleaned, size_freed = future.result()
+                            files_found += found
+                            files_cleaned += cleaned
+                            space_freed += size_freed
+                        except (PermissionError, OSError):
+                            pass
+                        
+                        # Progress is per root, never per file, and only when the value moves
+                        progress = 20 + 40 * done // len(tasks)
+                        if progress != last_progress:
+                            self.progress.emit(progress)
+                            last_progress = progress
             
             self.progress.emit(60)
             
-            # If no files found to delete, return early
-            if not files_to_delete:
+            # If no files were found, return early
+            if not files_found:
                 result = {
                     'files_cleaned': 0,
                     'space_freed_mb': 0,
@@ -147,26 +369,10 @@ class CleanupWorker(QThread):
                 self.finished.emit(result)
                 return
             
-            # Now actually delete the files
-            files_cleaned = 0
-            space_freed = 0
-            
-            for file_path, file_size in files_to_delete:
-                try:
-                    if os.path.isdir(file_path):
-                        shutil.rmtree(file_path)
-                    else:
-                        os.remove(file_path)
-                    files_cleaned += 1
-                    space_freed += file_size
-                except (PermissionError, FileNotFoundError, OSError):
-                    continue
-            
             self.progress.emit(90)
             
             # Clean recycle bin (Windows)
             try:
-                import subprocess
                 result_recycle = subprocess.run(['powershell', '-Command', 'Clear-RecycleBin -Force'], 
                                              capture_output=True, timeout=10)
                 if result_recycle.returncode == 0:
@@ -200,6 +406,149 @@ class CleanupWorker(QThread):
             self.finished.emit(result)
 
 
+class SecurityScanWorker(QThread):
+    """Worker thread for the basic security scan; reports one line at a time."""
+    
+    progress = pyqtSignal(int)
+    line = pyqtSignal(str)
+    
+    def __init__(self, startup_manager, check_startup=True, check_processes=True,
+                 check_network=True, check_files=False):
+        super().__init__()
+        self.startup_manager = startup_manager
+        self.check_startup = check_startup
+        self.check_processes = check_processes
+        self.check_network = check_network
+        self.check_files = check_files
+    
+    def run(self):
+        """Run the selected checks, emitting result lines as they are produced."""
+        emit = self.line.emit
+        self.progress.emit(0)
+        emit("=== SECURITY SCAN STARTED ===\n")
+        
+        if self.check_startup:
+            self.progress.emit(25)
+            emit("Checking startup programs...")
+            try:
+                startup_count = len(self.startup_manager.get_startup_programs())
+                emit(f"✓ Found {startup_count} startup programs - Review recommended")
+            except:
+                emit("✗ Could not access startup programs")
+            emit("")
+        
+        if self.check_processes:
+            self.progress.emit(50)
+            emit("Scanning running processes...")
+            try:
+                # The first cpu_percent call per process always reads 0.0; prime
+                # every counter, wait briefly, then read the real usage
+                procs = list(psutil.process_iter(['name']))
+                for proc in procs:
+                    try:
+                        proc.cpu_percent(None)
+                    except:
+                        pass
+                time.sleep(0.5)
+                
+                suspicious_processes = []
+                for proc in procs:
+                    try:
+                        if proc.cpu_percent(None) > 50:
+                            suspicious_processes.append(proc.info['name'])
+                    except:
+                        pass
+                
+                if suspicious_processes:
+                    emit(f"⚠ High CPU processes detected: {', '.join(suspicious_processes[:5])}")
+                else:
+                    emit("✓ No suspicious process activity detected")
+            except:
+                emit("✗ Could not scan processes")
+            emit("")
+        
+        if self.check_network:
+            self.progress.emit(75)
+            emit("Checking network connections...")
+            try:
+                listening_ports = []
+                common_ports = []
+                for conn in psutil.net_connections(kind='inet'):
+                    if conn.status == 'LISTEN':
+                        port = conn.laddr.port
+                        listening_ports.append(port)
+                        if port in COMMON_PORTS:
+                            common_ports.append(port)
+                emit(f"✓ Found {len(listening_ports)} listening ports")
+                if common_ports:
+                    emit(f"  Common service ports: {', '.join(map(str, common_ports))}")
+            except:
+                emit("✗ Could not check network connections")
+            emit("")
+        
+        if self.check_files:
+            self.progress.emit(90)
+            emit("Checking system file integrity...")
+            emit("ℹ For full system file check, run 'sfc /scannow' as administrator")
+            emit("")
+        
+        self.progress.emit(100)
+        emit("=== SECURITY SCAN COMPLETED ===")
+        emit("✓ Basic security scan finished")
+        emit("💡 For comprehensive security, use dedicated antivirus software")
+
+
+class DiskAnalysisWorker(QThread):
+    """Worker thread that sizes a drive's top-level folders, reporting each as it finishes."""
+    
+    folder_sized = pyqtSignal(str, object, int)  # name, size in bytes, files counted
+    folder_failed = pyqtSignal(str, str)  # name, reason
+    listing_failed = pyqtSignal(str)
+    
+    def __init__(self, drive):
+        super().__init__()
+        self.drive = drive
+        self._cancelled = False
+        self._futures = []
+    
+    def cancel(self):
+        """Drop folders that have not started; walks already running are capped and finish quickly."""
+        self._cancelled = True
+        for future in self._futures:
+            future.cancel()
+    
+    def run(self):
+        """Size every top-level folder concurrently; folder walks are I/O bound."""
+        try:
+            with os.scandir(self.drive) as it:
+                items = [entry.name for entry in it if entry.is_dir()]
+        except PermissionError:
+            self.listing_failed.emit("Access denied to analyze directories")
+            return
+        except Exception as e:
+            self.listing_failed.emit(f"Error listing directories: {str(e)}")
+            return
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(_dir_size, os.path.join(self.drive, item)): item
+                       for item in items}
+            self._futures = list(futures)
+            if self._cancelled:
+                self.cancel()
+            
+            for future in as_completed(futures):
+                if self._cancelled:
+                    break
+                item = futures[future]
+                try:
+                    size, file_count = future.result()
+                    self.folder_sized.emit(item, size, file_count)
+                except (PermissionError, FileNotFoundError, OSError):
+                    self.folder_failed.emit(item, "Access denied")
+                except Exception as e:
+                    self.folder_failed.emit(item, f"Error - {str(e)[:50]}")
+
+
 class SystemGraphWidget(QWidget):
     """Real-time system monitoring graph widget."""
     
@@ -209,13 +558,25 @@ class SystemGraphWidget(QWidget):
         self.color = QColor(color)
         self.max_value = max_value
         self.unit = unit
-        self.data_points = deque(maxlen=60)  # Store last 60 data points (1 minute at 1 second intervals)
-        self.timestamps = deque(maxlen=60)
-        
-        # Initialize with zeros
-        for i in range(60):
-            self.data_points.append(0)
-            self.timestamps.append(time.time() - (59 - i))
+        # Store last 60 data points (1 minute at 1 second intervals), initialized with zeros
+        now = time.time()
+        self.data_points = deque([0.0] * 60, maxlen=60)
+        self.timestamps = deque([now - (59 - i) for i in range(60)], maxlen=60)
+        
+        # Paint resources are built once instead of on every repaint
+        self._grid_pen = QPen(_GRID_COLOR, 1)
+        self._line_pen = QPen(self.color, 2)
+        self._fill_brush = QBrush(QColor(self.color.red(), self.color.green(), self.color.blue(), 30))
+        self._title_font = QFont(self.font())
+        self._title_font.setBold(True)
+        self._title_font.setPointSize(10)
+        self._value_font = QFont(self._title_font)
+        self._value_font.setPointSize(12)
+        self._label_font = QFont(self.font())
+        self._label_font.setBold(False)
+        self._label_font.setPointSize(8)
+        self._x_key = None
+        self._xs = []
         
         self.setMinimumSize(250, 120)
         # Remove maximum size to allow flexible resizing
@@ -248,14 +609,11 @@ class SystemGraphWidget(QWidget):
         graph_rect = rect.adjusted(margin, margin + 20, -margin, -margin - 20)
         
         # Draw background
-        painter.fillRect(rect, QColor("#f8f9fa"))
+        painter.fillRect(rect, _BG_COLOR)
         
         # Draw title
-        painter.setPen(QColor("#212529"))
-        font = painter.font()
-        font.setBold(True)
-        font.setPointSize(10)
-        painter.setFont(font)
+        painter.setPen(_FG_COLOR)
+        painter.setFont(self._title_font)
         painter.drawText(rect.adjusted(10, 5, -10, -rect.height() + 25), Qt.AlignLeft | Qt.AlignTop, self.title)
         
         # Draw current value
@@ -263,12 +621,12 @@ class SystemGraphWidget(QWidget):
             current_value = self.data_points[-1]
             value_text = f"{current_value:.1f}{self.unit}"
             painter.setPen(self.color)
-            font.setPointSize(12)
-            painter.setFont(font)
+            painter.setFont(self._value_font)
             painter.drawText(rect.adjusted(10, 5, -10, -rect.height() + 25), Qt.AlignRight | Qt.AlignTop, value_text)
         
         # Draw grid lines
-        painter.setPen(QPen(QColor("#e9ecef"), 1))
+        painter.setPen(self._grid_pen)
+        painter.setFont(self._label_font)
         
         # Horizontal grid lines
         for i in range(5):
@@ -277,12 +635,9 @@ class SystemGraphWidget(QWidget):
             
             # Draw value labels
             value = self.max_value * (4 - i) / 4
-            painter.setPen(QColor("#6c757d"))
-            font.setPointSize(8)
-            font.setBold(False)
-            painter.setFont(font)
+            painter.setPen(_LABEL_COLOR)
             painter.drawText(5, int(y + 4), f"{value:.0f}")
-            painter.setPen(QPen(QColor("#e9ecef"), 1))
+            painter.setPen(self._grid_pen)
         
         # Vertical grid lines
         for i in range(6):
@@ -291,52 +646,333 @@ class SystemGraphWidget(QWidget):
         
         # Draw the data line
         if len(self.data_points) > 1:
-            painter.setPen(QPen(self.color, 2))
+            painter.setPen(self._line_pen)
             
-            points = []
-            for i, value in enumerate(self.data_points):
-                if i == 0:
-                    continue
-                    
-                x = graph_rect.left() + (graph_rect.width() * i / (len(self.data_points) - 1))
-                y = graph_rect.bottom() - (graph_rect.height() * value / self.max_value)
-                points.append(QPointF(float(x), float(y)))
+            # Never draw more vertices than there are ~2 px columns to show them
+            count = len(self.data_points)
+            n_target = max(2, min(count, graph_rect.width() // 2))
+            step = (count - 1) / (n_target - 1)
+            samples = [self.data_points[round(i * step)] for i in range(n_target)]
+            
+            # X positions only change on resize, so they are cached per geometry
+            x_key = (graph_rect.left(), graph_rect.width(), n_target)
+            if self._x_key != x_key:
+                left = graph_rect.left()
+                x_step = graph_rect.width() / (n_target - 1)
+                self._xs = [left + x_step * i for i in range(n_target)]
+                self._x_key = x_key
+            
+            bottom = graph_rect.bottom()
+            y_scale = graph_rect.height() / self.max_value
+            points = [QPointF(x, bottom - y_scale * value) for x, value in zip(self._xs, samples)]
             
-            # Draw the line
-            if len(points) > 1:
-                for i in range(len(points) - 1):
-                    painter.drawLine(points[i], points[i + 1])
+            # Draw the line in a single call instead of one drawLine per segment
+            painter.drawPolyline(QPolygonF(points))
             
             # Fill area under the curve
-            if points:
-                painter.setBrush(QBrush(QColor(self.color.red(), self.color.green(), self.color.blue(), 30)))
-                painter.setPen(Qt.NoPen)
+            painter.setBrush(self._fill_brush)
+            painter.setPen(Qt.NoPen)
+            
+            polygon = QPolygonF([QPointF(float(graph_rect.left()), float(bottom))] + points +
+                                [QPointF(float(graph_rect.right()), float(bottom))])
+            painter.drawPolygon(polygon)
+
+
+class _SysSampler(QObject):
+    """Collects system metrics off the GUI thread and emits them as one dict."""
+    
+    sample = pyqtSignal(dict)
+    
+    def __init__(self):
+        super().__init__()
+        # Store previous network values for calculating speed
+        self.prev_net_recv = 0
+        self.prev_net_sent = 0
+        self.prev_time = time.time()
+        
+        # Disk usage barely moves second to second; refresh it every 10 ticks
+        self._disk_tick = 0
+        self._disk_pct = 0.0
+    
+    @pyqtSlot()
+    def prime_cpu(self):
+        """Start psutil's CPU counter; connected to QThread.started.
+        
+        psutil keeps the cpu_percent(None) baseline per thread, so priming has
+        to happen on the thread that polls or the first reading is 0.0.
+        """
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+    
+    @pyqtSlot()
+    def poll(self):
+        """Sample CPU, RAM, disk and network usage and emit the result."""
+        if psutil is None:
+            # If psutil is not available, emit dummy data
+            self.sample.emit({'cpu': 0, 'mem': 0, 'disk': 0, 'net': 0})
+            return
+        
+        # CPU Usage since the previous tick; never blocks
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        # RAM Usage
+        mem_percent = psutil.virtual_memory().percent
+        
+        # Disk Usage (primary drive); may block on a spun-down disk
+        if self._disk_tick % 10 == 0:
+            try:
+                disk_usage = psutil.disk_usage('C:\\')
+                self._disk_pct = (disk_usage.used / disk_usage.total) * 100
+            except:
+                self._disk_pct = 0.0
+        self._disk_tick += 1
+        
+        # Network Speed
+        net_speed = 0
+        try:
+            net_io = psutil.net_io_counters()
+            current_time = time.time()
+            time_delta = current_time - self.prev_time
+            
+            if time_delta > 0 and self.prev_net_recv > 0:
+                recv_speed = (net_io.bytes_recv - self.prev_net_recv) / time_delta / 1024  # KB/s
+                sent_speed = (net_io.bytes_sent - self.prev_net_sent) / time_delta / 1024  # KB/s
+                net_speed = min(recv_speed + sent_speed, 1000)  # Cap at 1000 KB/s for display
+            
+            self.prev_net_recv = net_io.bytes_recv
+            self.prev_net_sent = net_io.bytes_sent
+            self.prev_time = current_time
+        except:
+            pass
+        
+        self.sample.emit({'cpu': cpu_percent, 'mem': mem_percent, 'disk': self._disk_pct, 'net': net_speed})
+
+
+class SysStatsWorker(QObject):
+    """Gathers the dashboard status figures off the GUI thread."""
+    
+    stats_ready = pyqtSignal(dict)
+    
+    def __init__(self, boot_time=None):
+        super().__init__()
+        self._boot_time = boot_time
+        self._update_counter = 0
+        self._cached_disk_info = {}
+        self._cache_timeout = 10  # Cache disk info for 10 updates
+        self._cpu_ema = None
+        self._last_net_io = None
+        self._last_net_time = None
+        self._proc_count = None
+        self._proc_count_last_ts = None
+        
+        # Temperature sensors are unsupported on many systems (e.g. Windows); probe once
+        try:
+            self._has_temps = psutil is not None and bool(psutil.sensors_temperatures())
+        except Exception:
+            self._has_temps = False
+    
+    @pyqtSlot()
+    def prime_cpu(self):
+        """Start psutil's CPU counter on the polling thread (baselines are per thread)."""
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+    
+    @pyqtSlot()
+    def poll(self):
+        """Collect one sample and emit it; errors are reported in the dict."""
+        if psutil is None:
+            self.stats_ready.emit({'error': "psutil not available"})
+            return
+        
+        try:
+            stats = self._collect()
+        except Exception as e:
+            stats = {'error': str(e)}
+        self.stats_ready.emit(stats)
+    
+    def _collect(self):
+        """Query psutil for everything update_system_info displays."""
+        self._update_counter += 1
+        
+        # Non-blocking CPU read each cycle, smoothed with an exponential moving average
+        raw_cpu = psutil.cpu_percent(interval=None)
+        if self._cpu_ema is None:
+            self._cpu_ema = raw_cpu
+        else:
+            self._cpu_ema = 0.6 * self._cpu_ema + 0.4 * raw_cpu
+        cpu_percent = self._cpu_ema
+        
+        # Add CPU temperature monitoring if available
+        cpu_temp = None
+        if self._has_temps:
+            try:
+                for name, entries in psutil.sensors_temperatures().items():
+                    if 'cpu' in name.lower() or 'core' in name.lower():
+                        cpu_temp = entries[0].current if entries else None
+                        break
+            except Exception:
+                self._has_temps = False  # Sensors went away; stop asking
+        
+        # Cached Disk metrics for better performance
+        if self._update_counter % self._cache_timeout == 0 or not self._cached_disk_info:
+            try:
+                total_used = 0
+                total_size = 0
+                disk_info = []
                 
-                polygon = QPolygonF()
-                polygon.append(QPointF(float(graph_rect.left()), float(graph_rect.bottom())))
-                for point in points:
-                    polygon.append(point)
-                polygon.append(QPointF(float(graph_rect.right()), float(graph_rect.bottom())))
+                for partition, usage in _partition_usages(_get_partitions()):
+                    if usage is None:
+                        continue
+                    total_used += usage.used
+                    total_size += usage.total
+                    disk_info.append({
+                        'drive': partition.device,
+                        'percent': (usage.used / usage.total) * 100,
+                        'used_gb': usage.used / (1024**3),
+                        'total_gb': usage.total / (1024**3)
+                    })
                 
-                painter.drawPolygon(polygon)
+                self._cached_disk_info = {
+                    'total_percent': (total_used / total_size) * 100 if total_size > 0 else 0,
+                    'drives': disk_info,
+                    'total_used_gb': total_used / (1024**3),
+                    'total_size_gb': total_size / (1024**3)
+                }
+            except Exception as e:
+                self._cached_disk_info = {'total_percent': 0, 'drives': [], 'error': str(e)}
+        
+        # Network speed since the previous sample (totals on the first one)
+        try:
+            net_io = psutil.net_io_counters()
+            current_time = time.time()
+            network = None
+            
+            if self._last_net_io is not None:
+                time_delta = current_time - self._last_net_time
+                if time_delta > 0:
+                    recv_speed = (net_io.bytes_recv - self._last_net_io.bytes_recv) / time_delta / 1024  # KB/s
+                    sent_speed = (net_io.bytes_sent - self._last_net_io.bytes_sent) / time_delta / 1024  # KB/s
+                    network = ('speed', recv_speed, sent_speed)
+            else:
+                network = ('total', net_io.bytes_recv / (1024**2), net_io.bytes_sent / (1024**2))
+            
+            self._last_net_io = net_io
+            self._last_net_time = current_time
+        except:
+            network = None
+        
+        uptime_seconds = time.time() - self._boot_time if self._boot_time else None
+        
+        # Process count is a low-value metric; refresh it every 30 seconds
+        now = time.monotonic()
+        if self._proc_count_last_ts is None or now - self._proc_count_last_ts > 30:
+            try:
+                self._proc_count = len(psutil.pids())
+            except:
+                self._proc_count = None
+            self._proc_count_last_ts = now
+        process_count = self._proc_count
+        
+        try:
+            load_avg = psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
+        except:
+            load_avg = None
+        
+        return {
+            'cpu_percent': cpu_percent,
+            'cpu_temp': cpu_temp,
+            'memory': psutil.virtual_memory(),
+            'swap': psutil.swap_memory(),
+            'disk': self._cached_disk_info,
+            'network': network,
+            'uptime_seconds': uptime_seconds,
+            'process_count': process_count,
+            'load_avg': load_avg,
+        }
+
+
+class ProcessSnapshotWorker(QObject):
+    """Lists the busiest processes off the GUI thread for the process manager."""
+    
+    snapshot_ready = pyqtSignal(list, int)  # (top processes, total process count)
+    
+    TOP_COUNT = 15
+    SAMPLE_INTERVAL = 0.1  # Seconds between the priming and the measuring pass
+    
+    @pyqtSlot()
+    def run(self):
+        """Read pid, name, CPU and memory for every process and emit the top ones."""
+        # A process's first cpu_percent call only starts its counter; prime them all,
+        # wait a fixed interval, then measure so every value covers the same window
+        procs = list(psutil.process_iter(['pid', 'name']))
+        for proc in procs:
+            try:
+                proc.cpu_percent(None)
+            except psutil.Error:
+                pass
+        time.sleep(self.SAMPLE_INTERVAL)
+        
+        processes = []
+        for proc in procs:
+            try:
+                # as_dict reads under Process.oneshot(); denied fields come back as None
+                info = proc.as_dict(['cpu_percent', 'memory_percent'], ad_value=None)
+            except psutil.NoSuchProcess:
+                continue
+            info.update(proc.info)
+            processes.append(info)
+        
+        top = heapq.nlargest(self.TOP_COUNT, processes, key=lambda x: x['cpu_percent'] or 0)
+        self.snapshot_ready.emit(top, len(processes))
 
 
 class SystemGraphsWidget(QWidget):
     """Container widget for all system graphs."""
     
+    # Toggle button styles, built once rather than on every click
+    _PAUSE_QSS = """
+        QPushButton {
+            background-color: #6c757d;
+            color: white;
+            border: none;
+            padding: 5px 15px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #5a6268;
+        }
+    """
+    _RESUME_QSS = """
+        QPushButton {
+            background-color: #28a745;
+            color: white;
+            border: none;
+            padding: 5px 15px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #218838;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setup_ui()
         
-        # Create timer for updating graphs
+        # Metrics are sampled on a worker thread so slow syscalls never stall painting
+        self._sampler_thread = QThread(self)
+        self._sampler = _SysSampler()
+        self._sampler.moveToThread(self._sampler_thread)
+        self._sampler.sample.connect(self.update_graphs)
+        self._sampler_thread.started.connect(self._sampler.prime_cpu)
+        self._sampler_thread.start()
+        
+        # Create timer for updating graphs; the tick is queued to the sampler thread
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_graphs)
+        self.update_timer.timeout.connect(self._sampler.poll)
         self.update_timer.start(1000)  # Update every second
-        
-        # Store previous network values for calculating speed
-        self.prev_net_recv = 0
-        self.prev_net_sent = 0
-        self.prev_time = time.time()
     
     def setup_ui(self):
         """Set up the graphs UI."""
@@ -393,19 +1029,7 @@ class SystemGraphsWidget(QWidget):
         self.toggle_btn = QPushButton("⏸️ Pause Monitoring")
         self.toggle_btn.setFixedSize(150, 30)
         self.toggle_btn.clicked.connect(self.toggle_monitoring)
-        self.toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
+        self.toggle_btn.setStyleSheet(self._PAUSE_QSS)
         toggle_layout.addWidget(self.toggle_btn)
         
         layout.addLayout(toggle_layout)
@@ -415,102 +1039,126 @@ class SystemGraphsWidget(QWidget):
         if self.update_timer.isActive():
             self.update_timer.stop()
             self.toggle_btn.setText("▶️ Resume Monitoring")
-            self.toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #28a745;
-                    color: white;
-                    border: none;
-                    padding: 5px 15px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #218838;
-                }
-            """)
+            self.toggle_btn.setStyleSheet(self._RESUME_QSS)
         else:
             self.update_timer.start(1000)
             self.toggle_btn.setText("⏸️ Pause Monitoring")
-            self.toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #6c757d;
-                    color: white;
-                    border: none;
-                    padding: 5px 15px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #5a6268;
-                }
-            """)
+            self.toggle_btn.setStyleSheet(self._PAUSE_QSS)
     
-    def update_graphs(self):
-        """Update all graphs with current system data."""
-        try:
-            import psutil
-            
-            # CPU Usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.cpu_graph.add_data_point(cpu_percent)
-            
-            # RAM Usage
-            memory = psutil.virtual_memory()
-            self.ram_graph.add_data_point(memory.percent)
-            
-            # Disk Usage (primary drive)
-            try:
-                disk_usage = psutil.disk_usage('C:\\')
-                disk_percent = (disk_usage.used / disk_usage.total) * 100
-                self.disk_graph.add_data_point(disk_percent)
-            except:
-                self.disk_graph.add_data_point(0)
-            
-            # Network Speed
-            try:
-                net_io = psutil.net_io_counters()
-                current_time = time.time()
-                time_delta = current_time - self.prev_time
-                
-                if time_delta > 0 and self.prev_net_recv > 0:
-                    recv_speed = (net_io.bytes_recv - self.prev_net_recv) / time_delta / 1024  # KB/s
-                    sent_speed = (net_io.bytes_sent - self.prev_net_sent) / time_delta / 1024  # KB/s
-                    total_speed = recv_speed + sent_speed
-                    self.network_graph.add_data_point(min(total_speed, 1000))  # Cap at 1000 KB/s for display
-                else:
-                    self.network_graph.add_data_point(0)
-                
-                self.prev_net_recv = net_io.bytes_recv
-                self.prev_net_sent = net_io.bytes_sent
-                self.prev_time = current_time
-            except:
-                self.network_graph.add_data_point(0)
-                
-        except ImportError:
-            # If psutil is not available, add dummy data
-            self.cpu_graph.add_data_point(0)
-            self.ram_graph.add_data_point(0)
-            self.disk_graph.add_data_point(0)
-            self.network_graph.add_data_point(0)
+    def update_graphs(self, sample):
+        """Update all graphs with a sample emitted by the sampler thread."""
+        self.cpu_graph.add_data_point(sample['cpu'])
+        self.ram_graph.add_data_point(sample['mem'])
+        self.disk_graph.add_data_point(sample['disk'])
+        self.network_graph.add_data_point(sample['net'])
+    
+    def stop_sampling(self):
+        """Stop the timer and shut down the sampler thread."""
+        self.update_timer.stop()
+        self._sampler_thread.quit()
+        self._sampler_thread.wait()
 
 
 class MainWindow(QMainWindow):
     """Main application window with basic styling."""
     
+    _stats_requested = pyqtSignal()  # Queued to SysStatsWorker.poll
+    _processes_requested = pyqtSignal()  # Queued to ProcessSnapshotWorker.run
+    
+    # Simulated progress steps as (offset_ms, message, level); a None message only marks time
+    _MAINTENANCE_STEPS = (
+        (500, "Clearing system cache...", "INFO"),
+        (1000, "Optimizing memory usage...", "INFO"),
+        (1500, "Cleaning temporary files...", "INFO"),
+        (2000, "Defragmenting registry...", "INFO"),
+        (2500, "Updating system indexes...", "INFO"),
+        (3000, None, None),
+    )
+    _REGISTRY_SCAN_STEPS = (
+        (1000, "Scanning HKEY_CURRENT_USER...", "INFO"),
+        (2000, "Scanning HKEY_LOCAL_MACHINE...", "INFO"),
+        (3000, "Analyzing registry entries...", "INFO"),
+        (4000, "Registry scan completed - 0 issues found (safe mode)", "SUCCESS"),
+    )
+    
+    # Static status label prefixes; only the numeric tail is formatted per tick
+    _PFX_CPU = "🔥 CPU: "
+    _PFX_RAM = "🧠 RAM: "
+    _PFX_DISK = "💾 Disk: "
+    _PFX_NET = "🌐 Network: "
+    
+    # Usage bar chunk colors by band, applied only when a bar changes band.
+    # Precomputed sheets beat a dynamic "band" property, whose unpolish/polish
+    # round trip restyles the widget on every switch.
+    _BAR_QSS = {
+        'green': "QProgressBar::chunk { background-color: #27ae60; }",
+        'amber': "QProgressBar::chunk { background-color: #f39c12; }",
+        'red': "QProgressBar::chunk { background-color: #e74c3c; }",
+    }
+    
+    # Shared by every System Tools button through one rule on the group box
+    _BUTTON_QSS = """
+        QGroupBox QPushButton {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QGroupBox QPushButton:hover {
+            background-color: #2980b9;
+        }
+        QGroupBox QPushButton:pressed {
+            background-color: #21618c;
+        }
+    """
+    
+    # Minimum seconds between Refresh clicks that re-run the psutil sweeps
+    _PROC_REFRESH_COOLDOWN = 1.0
+    _DISK_REFRESH_COOLDOWN = 2.0
+    
+    # Read-only report panes in the tool dialogs
+    _TEXTEDIT_QSS = """
+        QTextEdit {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+            padding: 8px;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
+        self._mono_font = QFont("Consolas", 9)  # Shared by every report pane
         self.startup_window = None
         self.scheduler_dialog = None
         self.cleanup_worker = None
+        self.security_scan_worker = None
+        self.disk_analysis_worker = None
+        self._detached_disk_workers = set()  # Cancelled analyses still finishing their walks
+        self._process_thread = None  # Started the first time the process manager opens
+        self._process_worker = None
+        self._process_text = None
         self.duplicate_finder = None
         self.scan_thread = None
+        self.delete_thread = None
         self.settings = QSettings('PCMaintenance', 'Dashboard')
         
         # Performance optimization variables
-        self._update_counter = 0
-        self._last_cpu_time = None
-        self._cached_disk_info = {}
-        self._cache_timeout = 10  # Cache disk info for 10 updates
+        self._bar_bands = {}  # Current color band per usage bar
+        self._last_uptime_minute = -1  # Uptime text only changes once a minute
+        self._uptime_text = ""
+        self._static_sysinfo = None  # Filled by _static_system_info on first report
+        self._last_cpu_percent = None  # Latest SysStatsWorker CPU reading
+        self._last_proc_refresh = None  # Refresh click cooldowns (monotonic seconds)
+        self._last_disk_refresh = None
+        
+        # Boot time never changes while we run; read it once
+        try:
+            self._boot_time = psutil.boot_time() if psutil is not None else None
+        except Exception:
+            self._boot_time = None
         
         # Initialize system monitors
         self.system_monitor = SystemMonitor()
@@ -629,6 +1277,10 @@ class MainWindow(QMainWindow):
         system_layout.addWidget(processes_title, 1, 4)
         system_layout.addWidget(self.processes_label, 1, 5)
         
+        # Every metric value label, for handlers that reset them all at once
+        self._status_labels = (self.cpu_label, self.memory_label, self.disk_label,
+                               self.network_label, self.uptime_label, self.processes_label)
+        
         # Add progress bars for visual feedback
         def create_progress_bar():
             progress = QProgressBar()
@@ -743,22 +1395,8 @@ class MainWindow(QMainWindow):
         self.benchmark_btn.clicked.connect(self.run_performance_benchmark)
         
         # Style buttons
-        button_style = """
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """
+        # Style is parsed once on the group instead of once per button
+        tools_group.setStyleSheet(self._BUTTON_QSS)
         
         for btn in [self.startup_btn, self.maintenance_btn, self.browser_cleanup_btn, 
                    self.duplicate_finder_btn, self.registry_cleaner_btn, self.process_manager_btn,
@@ -766,7 +1404,6 @@ class MainWindow(QMainWindow):
                    self.service_manager_btn, self.memory_optimizer_btn, self.security_scan_btn,
                    self.defrag_btn, self.system_restore_btn, self.driver_update_btn, self.power_options_btn,
                    self.benchmark_btn]:
-            btn.setStyleSheet(button_style)
             btn.setMinimumHeight(40)
         
         # Add buttons to layout (4 rows now) with proper stretching
@@ -824,13 +1461,15 @@ class MainWindow(QMainWindow):
         log_layout.addLayout(log_controls)
         
         # Enhanced activity log with responsive height
-        self.activity_log = QTextEdit()
+        self.activity_log = QPlainTextEdit()
         self.activity_log.setMinimumHeight(120)
         self.activity_log.setMaximumHeight(250)
         self.activity_log.setReadOnly(True)
+        self.activity_log.setMaximumBlockCount(1000)  # Oldest lines drop off automatically
+        self.activity_log.setUndoRedoEnabled(False)  # Read-only log; no undo stack to grow
         self.activity_log.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         self.activity_log.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: 'Consolas', 'Courier New', monospace;
                 font-size: 9pt;
                 background-color: #f8f9fa;
@@ -842,10 +1481,30 @@ class MainWindow(QMainWindow):
         
         log_layout.addWidget(self.activity_log)
         
+        # One character format per log color, reused for every appended line
+        self._log_formats = {}
+        for color in ('#e74c3c', '#f39c12', '#27ae60', '#c0392b', '#2c3e50'):
+            log_format = QTextCharFormat()
+            log_format.setForeground(QColor(color))
+            self._log_formats[color] = log_format
+        self._log_formats['#c0392b'].setFontWeight(QFont.Bold)
+        
+        # (level, color, line) records are the source of truth; the widget only shows a filtered view
+        self._log_records = deque(maxlen=1000)
+        self._ts_cache = (None, "")  # (epoch second, "%H:%M:%S") of the last log line
+        self._log_min_level = LOG_DEBUG
+        
+        # Lines are buffered and written in one batch at most every 100 ms
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        
         main_layout.addWidget(log_group)
         
         # Status bar
-        status_bar = self.statusBar()
+        status_bar = self._status_bar = self.statusBar()
         status_bar.showMessage("🚀 Professional System Monitor Ready - Real-time diagnostics active")
         
         # Log messages will be added after UI setup is complete
@@ -854,7 +1513,12 @@ class MainWindow(QMainWindow):
         self._last_net_io = None
         self._last_update_time = None
         self._system_alerts = []
-        self._performance_history = {'cpu': [], 'memory': [], 'network': []}
+        # Keep last 60 data points (10 minutes of history) in fixed-size ring buffers
+        self._performance_history = {key: deque(maxlen=60) for key in ('cpu', 'memory', 'network')}
+        
+        # Running sum of the last five CPU samples for the health check
+        self._cpu_last5 = deque(maxlen=5)
+        self._cpu_last5_sum = 0.0
         
         # Set window icon and professional styling
         self.setWindowIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
@@ -867,15 +1531,15 @@ class MainWindow(QMainWindow):
                                    QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            self.activity_log.clear()
-            if hasattr(self, '_full_log_content'):
-                self._full_log_content = ""
+            with QSignalBlocker(self.activity_log):
+                self.activity_log.clear()
+            self._log_records.clear()
+            self._log_buffer.clear()
             self.log_activity("Activity log cleared by user", "INFO")
-            self.statusBar().showMessage("Activity log cleared", 3000)
+            self._status_bar.showMessage("Activity log cleared", 3000)
     
     def export_activity_log(self):
         """Export activity log to file."""
-        from datetime import datetime
         
         filename, _ = QFileDialog.getSaveFileName(
             self,
@@ -886,7 +1550,8 @@ class MainWindow(QMainWindow):
         
         if filename:
             try:
-                # Extract plain text from HTML formatted log
+                # Make sure buffered lines are included
+                self._flush_log()
                 plain_text = self.activity_log.toPlainText()
                 with open(filename, 'w', encoding='utf-8') as f:
                     f.write(f"PC Maintenance Dashboard v2.0 Professional - Activity Log\n")
@@ -902,41 +1567,28 @@ class MainWindow(QMainWindow):
     
     def filter_log_display(self, filter_level):
         """Filter log display based on selected level."""
-        # Store original content if not already stored
-        if not hasattr(self, '_full_log_content'):
-            self._full_log_content = self.activity_log.toHtml()
-        
-        # Apply filter based on level
-        if filter_level == "All":
-            self.activity_log.setHtml(self._full_log_content)
-        elif filter_level == "Errors Only":
-            filtered_content = self._filter_log_by_keywords(["❌", "ERROR", "🚨", "CRITICAL"])
-            self.activity_log.setHtml(filtered_content)
-        elif filter_level == "Warnings+":
-            filtered_content = self._filter_log_by_keywords(["❌", "ERROR", "⚠️", "WARNING", "🚨", "CRITICAL", "🟡", "🔴"])
-            self.activity_log.setHtml(filtered_content)
-        elif filter_level == "Info+":
-            # Show everything except debug messages (if any)
-            self.activity_log.setHtml(self._full_log_content)
+        self._log_min_level = LOG_FILTER_MIN_LEVEL.get(filter_level, LOG_DEBUG)
         
-        self.log_activity(f"Log filter applied: {filter_level}", "INFO")
-    
-    def _filter_log_by_keywords(self, keywords):
-        """Filter log content by keywords."""
-        if not hasattr(self, '_full_log_content'):
-            return self.activity_log.toHtml()
-        
-        lines = self._full_log_content.split('<br>')
-        filtered_lines = []
-        
-        for line in lines:
-            if any(keyword in line for keyword in keywords):
-                filtered_lines.append(line)
-        
-        return '<br>'.join(filtered_lines)
+        # Re-render once from the stored records (buffered lines included), in a single edit block
+        # Widget signals are blocked so listeners do not react to each intermediate change
+        self._log_buffer.clear()
+        with QSignalBlocker(self.activity_log):
+            self.activity_log.clear()
+            cursor = QTextCursor(self.activity_log.document())
+            cursor.beginEditBlock()
+            for level, color, line in self._log_records:
+                if level >= self._log_min_level:
+                    self._append_log_line(cursor, color, line)
+            cursor.endEditBlock()
         
-        # Add professional status indicators
-        self._setup_professional_indicators()
+        self.log_activity(f"Log filter applied: {filter_level}", "INFO")
+    
+    def _append_log_line(self, cursor, color, line):
+        """Append one colored line at the end of the activity log."""
+        cursor.movePosition(QTextCursor.End)
+        if not self.activity_log.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(line, self._log_formats[color])
     
     def create_menu_bar(self):
         """Create the menu bar."""
@@ -1011,10 +1663,30 @@ class MainWindow(QMainWindow):
     def setup_timer(self):
         """Set up optimized monitoring timers with reduced frequency."""
         # Optimized system monitoring - every 5 seconds for better responsiveness
+        # psutil queries run on a worker thread; the GUI only applies the results
+        self._stats_thread = QThread(self)
+        self._stats_worker = SysStatsWorker(self._boot_time)
+        self._stats_worker.moveToThread(self._stats_thread)
+        self._stats_requested.connect(self._stats_worker.poll)
+        self._stats_worker.stats_ready.connect(self._apply_stats)
+        self._stats_thread.started.connect(self._stats_worker.prime_cpu)
+        self._stats_thread.start()
+        
         self.main_timer = QTimer()
         self.main_timer.timeout.connect(self.update_system_info)
         self.main_timer.start(5000)
         
+        # One 100 ms driver timer walks every running progress schedule
+        self._log_schedules = []  # [start_ms, steps, next_index, on_done]
+        self._schedule_timer = QTimer(self)
+        self._schedule_timer.setInterval(100)
+        self._schedule_timer.timeout.connect(self._advance_log_schedules)
+        
+        # Prime this thread's CPU counter for force_initial_update; the stats
+        # worker primes its own on its thread
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+        
         # Disable heavy background tasks to improve performance
         # Performance history tracking disabled
         # System health checks disabled
@@ -1033,10 +1705,10 @@ class MainWindow(QMainWindow):
     def force_initial_update(self):
         """Force an initial system update to show data immediately."""
         try:
-            import psutil
+            _require_psutil()
             
             # Get system info with proper intervals for accuracy
-            cpu_percent = psutil.cpu_percent(interval=1)  # 1 second for accurate reading
+            cpu_percent = psutil.cpu_percent(interval=None)  # Delta since the prime in setup_timer
             memory = psutil.virtual_memory()
             
             # Update labels with detailed info
@@ -1074,9 +1746,7 @@ class MainWindow(QMainWindow):
             
             # System uptime
             try:
-                import time
-                from datetime import timedelta
-                boot_time = psutil.boot_time()
+                boot_time = self._boot_time
                 uptime_seconds = time.time() - boot_time
                 uptime_delta = timedelta(seconds=int(uptime_seconds))
                 
@@ -1128,11 +1798,6 @@ class MainWindow(QMainWindow):
     def update_performance_history(self):
         """Track performance history for trend analysis."""
         try:
-            import psutil
-            
-            # Keep last 60 data points (10 minutes of history)
-            max_history = 60
-            
             cpu_percent = psutil.cpu_percent(interval=0.1)
             memory_percent = psutil.virtual_memory().percent
             
@@ -1146,13 +1811,12 @@ class MainWindow(QMainWindow):
             
             # Update history
             self._performance_history['cpu'].append(cpu_percent)
+            if len(self._cpu_last5) == 5:
+                self._cpu_last5_sum -= self._cpu_last5[0]
+            self._cpu_last5_sum += cpu_percent
+            self._cpu_last5.append(cpu_percent)
             self._performance_history['memory'].append(memory_percent)
             self._performance_history['network'].append(network_throughput)
-            
-            # Trim history to max length
-            for key in self._performance_history:
-                if len(self._performance_history[key]) > max_history:
-                    self._performance_history[key] = self._performance_history[key][-max_history:]
                     
         except Exception as e:
             self.log_activity(f"Performance history update error: {str(e)}")
@@ -1160,13 +1824,11 @@ class MainWindow(QMainWindow):
     def perform_health_checks(self):
         """Perform comprehensive system health checks."""
         try:
-            import psutil
-            
             alerts = []
             
             # CPU health check
             if len(self._performance_history['cpu']) > 5:
-                avg_cpu = sum(self._performance_history['cpu'][-5:]) / 5
+                avg_cpu = self._cpu_last5_sum / 5
                 if avg_cpu > 90:
                     alerts.append("🔴 CPU usage critically high for extended period")
                 elif avg_cpu > 80:
@@ -1181,19 +1843,14 @@ class MainWindow(QMainWindow):
             
             # Disk health check
             try:
-                partitions = psutil.disk_partitions()
-                for partition in partitions:
-                    if 'cdrom' in partition.opts or partition.fstype == '':
-                        continue
-                    try:
-                        usage = psutil.disk_usage(partition.mountpoint)
-                        percent = (usage.used / usage.total) * 100
-                        if percent > 95:
-                            alerts.append(f"🔴 Drive {partition.device} critically full ({percent:.0f}%)")
-                        elif percent > 90:
-                            alerts.append(f"🟡 Drive {partition.device} running low on space ({percent:.0f}%)")
-                    except (PermissionError, FileNotFoundError):
+                for partition, usage in _partition_usages(_get_partitions()):
+                    if usage is None:
                         continue
+                    percent = (usage.used / usage.total) * 100
+                    if percent > 95:
+                        alerts.append(f"🔴 Drive {partition.device} critically full ({percent:.0f}%)")
+                    elif percent > 90:
+                        alerts.append(f"🟡 Drive {partition.device} running low on space ({percent:.0f}%)")
             except Exception:
                 pass
             
@@ -1203,9 +1860,9 @@ class MainWindow(QMainWindow):
             # Log significant alerts
             for alert in alerts:
                 if "🔴" in alert:
-                    self.log_activity(f"CRITICAL ALERT: {alert}")
+                    self.log_activity(f"CRITICAL ALERT: {alert}", "CRITICAL")
                 elif "🟡" in alert and alert not in getattr(self, '_last_alerts', []):
-                    self.log_activity(f"WARNING: {alert}")
+                    self.log_activity(f"WARNING: {alert}", "WARNING")
             
             self._last_alerts = alerts.copy()
             
@@ -1213,265 +1870,193 @@ class MainWindow(QMainWindow):
             self.log_activity(f"Health check error: {str(e)}")
         
     def update_system_info(self):
-        """Optimized system information update with caching and performance improvements."""
-        try:
-            import psutil
-            import time
-            from datetime import datetime, timedelta
-            
-            self._update_counter += 1
-            
-            # Optimized CPU usage - use cached value for frequent updates
-            if self._update_counter % 2 == 0:  # Update CPU every other cycle
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                self._last_cpu_percent = cpu_percent
-            else:
-                cpu_percent = getattr(self, '_last_cpu_percent', 0)
-            
-            # Add CPU temperature monitoring if available
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    cpu_temp = None
-                    for name, entries in temps.items():
-                        if 'cpu' in name.lower() or 'core' in name.lower():
-                            cpu_temp = entries[0].current if entries else None
-                            break
-                    if cpu_temp:
-                        self.cpu_label.setText(f"🔥 CPU: {cpu_percent:.1f}% ({cpu_temp:.0f}°C)")
-                    else:
-                        self.cpu_label.setText(f"🔥 CPU: {cpu_percent:.1f}%")
-                else:
-                    self.cpu_label.setText(f"🔥 CPU: {cpu_percent:.1f}%")
-            except:
-                self.cpu_label.setText(f"🔥 CPU: {cpu_percent:.1f}%")
-            
-            # Enhanced Memory metrics with swap info
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
-            memory_gb = memory.used / (1024**3)
-            total_gb = memory.total / (1024**3)
+        """Ask the stats worker for a fresh sample; results arrive in _apply_stats."""
+        self._stats_requested.emit()
+    
+    def _apply_stats(self, stats):
+        """Show a sample from SysStatsWorker; only cheap widget updates happen here."""
+        if 'error' in stats:
+            self.log_activity(f"System monitoring error: {stats['error']}", "ERROR")
             
-            if swap.total > 0:
-                swap_gb = swap.used / (1024**3)
-                self.memory_label.setText(f"🧠 RAM: {memory.percent:.1f}% ({memory_gb:.1f}/{total_gb:.1f}GB) | Swap: {swap_gb:.1f}GB")
+            # Fallback display
+            self._set_label_text(self.cpu_label, self._PFX_CPU + "Error")
+            self._set_label_text(self.memory_label, self._PFX_RAM + "Error")
+            self._set_label_text(self.disk_label, self._PFX_DISK + "Error")
+            self._set_label_text(self.network_label, self._PFX_NET + "Error")
+            self._set_label_text(self.uptime_label, "⏱️ Error")
+            self._set_label_text(self.processes_label, "⚙️ Error")
+            return
+        
+        cpu_percent = self._last_cpu_percent = stats['cpu_percent']
+        cpu_temp = stats['cpu_temp']
+        if cpu_temp:
+            self._set_label_text(self.cpu_label, self._PFX_CPU + f"{cpu_percent:.1f}% ({cpu_temp:.0f}°C)")
+        else:
+            self._set_label_text(self.cpu_label, self._PFX_CPU + f"{cpu_percent:.1f}%")
+        
+        # Enhanced Memory metrics with swap info
+        memory = stats['memory']
+        swap = stats['swap']
+        memory_gb = memory.used / (1024**3)
+        total_gb = memory.total / (1024**3)
+        
+        if swap.total > 0:
+            swap_gb = swap.used / (1024**3)
+            self._set_label_text(self.memory_label, self._PFX_RAM + f"{memory.percent:.1f}% ({memory_gb:.1f}/{total_gb:.1f}GB) | Swap: {swap_gb:.1f}GB")
+        else:
+            self._set_label_text(self.memory_label, self._PFX_RAM + f"{memory.percent:.1f}% ({memory_gb:.1f}/{total_gb:.1f}GB)")
+        
+        # Display cached disk info
+        disk_info = stats['disk']
+        if disk_info and 'error' not in disk_info:
+            if len(disk_info['drives']) > 1:
+                self._set_label_text(self.disk_label, self._PFX_DISK + f"{disk_info['total_percent']:.1f}% ({disk_info['total_used_gb']:.0f}/{disk_info['total_size_gb']:.0f}GB) | {len(disk_info['drives'])} drives")
+            elif disk_info['drives']:
+                drive = disk_info['drives'][0]
+                self._set_label_text(self.disk_label, f"💾 {drive['drive']} {drive['percent']:.1f}% ({drive['used_gb']:.0f}/{drive['total_gb']:.0f}GB)")
             else:
-                self.memory_label.setText(f"🧠 RAM: {memory.percent:.1f}% ({memory_gb:.1f}/{total_gb:.1f}GB)")
-            
-            # Cached Disk metrics for better performance
-            if self._update_counter % self._cache_timeout == 0 or not self._cached_disk_info:
-                try:
-                    partitions = psutil.disk_partitions()
-                    total_used = 0
-                    total_size = 0
-                    disk_info = []
-                    
-                    for partition in partitions:
-                        if 'cdrom' in partition.opts or partition.fstype == '':
-                            continue
-                        try:
-                            usage = psutil.disk_usage(partition.mountpoint)
-                            total_used += usage.used
-                            total_size += usage.total
-                            disk_info.append({
-                                'drive': partition.device,
-                                'percent': (usage.used / usage.total) * 100,
-                                'used_gb': usage.used / (1024**3),
-                                'total_gb': usage.total / (1024**3)
-                            })
-                        except (PermissionError, FileNotFoundError):
-                            continue
-                    
-                    self._cached_disk_info = {
-                        'total_percent': (total_used / total_size) * 100 if total_size > 0 else 0,
-                        'drives': disk_info,
-                        'total_used_gb': total_used / (1024**3),
-                        'total_size_gb': total_size / (1024**3)
-                    }
-                except Exception as e:
-                    self._cached_disk_info = {'total_percent': 0, 'drives': [], 'error': str(e)}
-            
-            # Display cached disk info
-            if self._cached_disk_info and 'error' not in self._cached_disk_info:
-                cache = self._cached_disk_info
-                if len(cache['drives']) > 1:
-                    self.disk_label.setText(f"💾 Disk: {cache['total_percent']:.1f}% ({cache['total_used_gb']:.0f}/{cache['total_size_gb']:.0f}GB) | {len(cache['drives'])} drives")
-                elif cache['drives']:
-                    drive = cache['drives'][0]
-                    self.disk_label.setText(f"💾 {drive['drive']} {drive['percent']:.1f}% ({drive['used_gb']:.0f}/{drive['total_gb']:.0f}GB)")
-                else:
-                    self.disk_label.setText("💾 Disk: No drives found")
+                self._set_label_text(self.disk_label, self._PFX_DISK + "No drives found")
+        else:
+            self._set_label_text(self.disk_label, self._PFX_DISK + "Error")
+        
+        # Network speed, or transfer totals on the first sample
+        network = stats['network']
+        if network is None:
+            self._set_label_text(self.network_label, self._PFX_NET + "--")
+        elif network[0] == 'speed':
+            _, recv_speed, sent_speed = network
+            if recv_speed > 1024 or sent_speed > 1024:
+                self._set_label_text(self.network_label, self._PFX_NET + f"↓{recv_speed/1024:.1f}MB/s ↑{sent_speed/1024:.1f}MB/s")
             else:
-                self.disk_label.setText("💾 Disk: Error")
-            
-            # Enhanced Network info with speed calculation
-            try:
-                net_io = psutil.net_io_counters()
-                current_time = time.time()
-                
-                if hasattr(self, '_last_net_io') and hasattr(self, '_last_net_time'):
-                    time_delta = current_time - self._last_net_time
-                    if time_delta > 0:
-                        recv_speed = (net_io.bytes_recv - self._last_net_io.bytes_recv) / time_delta / 1024  # KB/s
-                        sent_speed = (net_io.bytes_sent - self._last_net_io.bytes_sent) / time_delta / 1024  # KB/s
-                        
-                        if recv_speed > 1024 or sent_speed > 1024:
-                            self.network_label.setText(f"🌐 Network: ↓{recv_speed/1024:.1f}MB/s ↑{sent_speed/1024:.1f}MB/s")
-                        else:
-                            self.network_label.setText(f"🌐 Network: ↓{recv_speed:.0f}KB/s ↑{sent_speed:.0f}KB/s")
-                else:
-                    recv_mb = net_io.bytes_recv / (1024**2)
-                    sent_mb = net_io.bytes_sent / (1024**2)
-                    self.network_label.setText(f"🌐 Network: ↓{recv_mb:.0f}MB ↑{sent_mb:.0f}MB")
-                
-                self._last_net_io = net_io
-                self._last_net_time = current_time
-            except:
-                self.network_label.setText("🌐 Network: --")
-            
-            # Enhanced uptime with more detail
-            try:
-                boot_time = psutil.boot_time()
-                uptime_seconds = time.time() - boot_time
-                uptime_delta = timedelta(seconds=int(uptime_seconds))
-                
-                days = uptime_delta.days
-                hours, remainder = divmod(uptime_delta.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
+                self._set_label_text(self.network_label, self._PFX_NET + f"↓{recv_speed:.0f}KB/s ↑{sent_speed:.0f}KB/s")
+        else:
+            _, recv_mb, sent_mb = network
+            self._set_label_text(self.network_label, self._PFX_NET + f"↓{recv_mb:.0f}MB ↑{sent_mb:.0f}MB")
+        
+        # Enhanced uptime with more detail
+        uptime_seconds = stats['uptime_seconds']
+        if uptime_seconds is None:
+            self._set_label_text(self.uptime_label, "⏱️ Unknown")
+        else:
+            current_min = int(uptime_seconds // 60)
+            if current_min != self._last_uptime_minute:
+                days, remainder = divmod(current_min, 1440)
+                hours, minutes = divmod(remainder, 60)
                 
                 if days > 7:
-                    self.uptime_label.setText(f"⏱️ {days}d {hours}h (Restart recommended)")
+                    self._uptime_text = f"⏱️ {days}d {hours}h (Restart recommended)"
                 elif days > 0:
-                    self.uptime_label.setText(f"⏱️ {days}d {hours}h {minutes}m")
-                else:
-                    self.uptime_label.setText(f"⏱️ {hours}h {minutes}m")
-            except:
-                self.uptime_label.setText("⏱️ Unknown")
-            
-            # Enhanced process count with load average
-            try:
-                process_count = len(psutil.pids())
-                load_avg = psutil.getloadavg() if hasattr(psutil, 'getloadavg') else None
-                
-                if load_avg:
-                    self.processes_label.setText(f"⚙️ {process_count} processes (Load: {load_avg[0]:.1f})")
+                    self._uptime_text = f"⏱️ {days}d {hours}h {minutes}m"
                 else:
-                    # Calculate rough load based on CPU
-                    if cpu_percent > 80:
-                        load_status = "High"
-                    elif cpu_percent > 50:
-                        load_status = "Medium"
-                    else:
-                        load_status = "Low"
-                    self.processes_label.setText(f"⚙️ {process_count} processes ({load_status} load)")
-            except:
-                self.processes_label.setText("⚙️ Unknown")
-            
-            # Update progress bars with color coding
-            self.cpu_progress.setValue(int(cpu_percent))
-            self.memory_progress.setValue(int(memory.percent))
-            
-            # Color code progress bars based on usage
+                    self._uptime_text = f"⏱️ {hours}h {minutes}m"
+                self._last_uptime_minute = current_min
+            self._set_label_text(self.uptime_label, self._uptime_text)
+        
+        # Enhanced process count with load average
+        process_count = stats['process_count']
+        load_avg = stats['load_avg']
+        if process_count is None:
+            self._set_label_text(self.processes_label, "⚙️ Unknown")
+        elif load_avg:
+            self._set_label_text(self.processes_label, f"⚙️ {process_count} processes (Load: {load_avg[0]:.1f})")
+        else:
+            # Calculate rough load based on CPU
             if cpu_percent > 80:
-                self.cpu_progress.setStyleSheet("QProgressBar::chunk { background-color: #e74c3c; }")
-            elif cpu_percent > 60:
-                self.cpu_progress.setStyleSheet("QProgressBar::chunk { background-color: #f39c12; }")
-            else:
-                self.cpu_progress.setStyleSheet("QProgressBar::chunk { background-color: #27ae60; }")
-            
-            if memory.percent > 80:
-                self.memory_progress.setStyleSheet("QProgressBar::chunk { background-color: #e74c3c; }")
-            elif memory.percent > 60:
-                self.memory_progress.setStyleSheet("QProgressBar::chunk { background-color: #f39c12; }")
+                load_status = "High"
+            elif cpu_percent > 50:
+                load_status = "Medium"
             else:
-                self.memory_progress.setStyleSheet("QProgressBar::chunk { background-color: #27ae60; }")
-            
-            try:
-                if self._cached_disk_info and 'total_percent' in self._cached_disk_info:
-                    disk_percent = self._cached_disk_info['total_percent']
-                    self.disk_progress.setValue(int(disk_percent))
-                    
-                    if disk_percent > 90:
-                        self.disk_progress.setStyleSheet("QProgressBar::chunk { background-color: #e74c3c; }")
-                    elif disk_percent > 75:
-                        self.disk_progress.setStyleSheet("QProgressBar::chunk { background-color: #f39c12; }")
-                    else:
-                        self.disk_progress.setStyleSheet("QProgressBar::chunk { background-color: #27ae60; }")
-            except:
-                pass
-            
-        except Exception as e:
-            error_msg = str(e)
-            self.log_activity(f"System monitoring error: {error_msg}", "ERROR")
-            
-            # Fallback display
-            self.cpu_label.setText("🔥 CPU: Error")
-            self.memory_label.setText("🧠 RAM: Error")
-            self.disk_label.setText("💾 Disk: Error")
-            self.network_label.setText("🌐 Network: Error")
-            self.uptime_label.setText("⏱️ Error")
-            self.processes_label.setText("⚙️ Error")
+                load_status = "Low"
+            self._set_label_text(self.processes_label, f"⚙️ {process_count} processes ({load_status} load)")
+        
+        # Update progress bars with color coding
+        self.cpu_progress.setValue(int(cpu_percent))
+        self.memory_progress.setValue(int(memory.percent))
+        
+        # Color code progress bars based on usage
+        self._set_bar_band(self.cpu_progress, cpu_percent, 60, 80)
+        self._set_bar_band(self.memory_progress, memory.percent, 60, 80)
+        
+        if disk_info and 'total_percent' in disk_info:
+            disk_percent = disk_info['total_percent']
+            self.disk_progress.setValue(int(disk_percent))
+            self._set_bar_band(self.disk_progress, disk_percent, 75, 90)
+    
+    def _set_label_text(self, label, text):
+        """Set a label's text only when it differs from what is shown."""
+        # Compare against the widget itself so setText calls elsewhere never leave a stale cache
+        if label.text() != text:
+            label.setText(text)
+    
+    def _set_bar_band(self, bar, value, amber, red):
+        """Restyle a usage bar only when its color band actually changes."""
+        band = 'red' if value > red else 'amber' if value > amber else 'green'
+        if self._bar_bands.get(bar) != band:
+            bar.setStyleSheet(self._BAR_QSS[band])
+            self._bar_bands[bar] = band
+    
+    def _set_status_labels(self, text):
+        """Show the same text in every metric label with a single repaint."""
+        self.setUpdatesEnabled(False)
+        for label in self._status_labels:
+            label.setText(text)
+        self.setUpdatesEnabled(True)
     
     def _handle_psutil_error(self, error_msg):
         """Handle psutil import errors professionally."""
-        self.cpu_label.setText("N/A - Install psutil")
-        self.memory_label.setText("N/A - Install psutil")
-        self.disk_label.setText("N/A - Install psutil")
-        self.network_label.setText("N/A - Install psutil")
-        self.uptime_label.setText("N/A - Install psutil")
-        self.processes_label.setText("N/A - Install psutil")
-        self.statusBar().showMessage("❌ System monitoring unavailable - Install psutil")
-        self.log_activity(f"ERROR: {error_msg}")
+        self._set_status_labels("N/A - Install psutil")
+        self._status_bar.showMessage("❌ System monitoring unavailable - Install psutil")
+        self.log_activity(f"ERROR: {error_msg}", "ERROR")
     
     def _handle_system_error(self, error_msg):
         """Handle system monitoring errors professionally."""
-        self.cpu_label.setText("Error")
-        self.memory_label.setText("Error")
-        self.disk_label.setText("Error")
-        self.network_label.setText("Error")
-        self.uptime_label.setText("Error")
-        self.processes_label.setText("Error")
-        self.statusBar().showMessage("❌ System monitoring error")
-        self.log_activity(f"ERROR: {error_msg}")
+        self._set_status_labels("Error")
+        self._status_bar.showMessage("❌ System monitoring error")
+        self.log_activity(f"ERROR: {error_msg}", "ERROR")
     
     def log_activity(self, message: str, level="INFO"):
         """Professional activity logging with levels and formatting."""
-        from datetime import datetime
-        
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Bursts of messages share one formatted timestamp per second
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, datetime.fromtimestamp(now).strftime("%H:%M:%S"))
+        timestamp = self._ts_cache[1]
         
         # Color coding based on level
-        if level == "ERROR" or "ERROR:" in message:
-            formatted_message = f"<span style='color: #e74c3c;'>[{timestamp}] ❌ {message}</span>"
-        elif level == "WARNING" or "WARNING:" in message or "🟡" in message:
-            formatted_message = f"<span style='color: #f39c12;'>[{timestamp}] ⚠️ {message}</span>"
-        elif level == "SUCCESS" or "completed" in message.lower() or "✅" in message:
-            formatted_message = f"<span style='color: #27ae60;'>[{timestamp}] ✅ {message}</span>"
-        elif "CRITICAL" in message or "🔴" in message:
-            formatted_message = f"<span style='color: #c0392b; font-weight: bold;'>[{timestamp}] 🚨 {message}</span>"
-        else:
-            formatted_message = f"<span style='color: #2c3e50;'>[{timestamp}] ℹ️ {message}</span>"
+        severity, color, icon = LOG_LEVEL_FORMAT.get(level, LOG_LEVEL_FORMAT["INFO"])
+        formatted_message = f"[{timestamp}] {icon} {message}"
         
-        # Use HTML formatting for rich text
-        cursor = self.activity_log.textCursor()
-        cursor.movePosition(cursor.End)
-        cursor.insertHtml(formatted_message + "<br>")
+        self._log_records.append((severity, color, formatted_message))
         
-        # Update full log content for filtering
-        if hasattr(self, '_full_log_content'):
-            self._full_log_content = self.activity_log.toHtml()
+        # Only lines at or above the active filter level reach the widget
+        if severity < self._log_min_level:
+            return
         
-        # Auto-scroll to bottom
-        scrollbar = self.activity_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # Bursts of messages are coalesced into one layout pass by _flush_log
+        self._log_buffer.append((color, formatted_message))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log(self):
+        """Write buffered log lines to the widget in a single edit block."""
+        if not self._log_buffer:
+            return
         
-        # Limit log size to prevent memory issues
-        if self.activity_log.document().blockCount() > 1000:
-            cursor.movePosition(cursor.Start)
-            cursor.movePosition(cursor.Down, cursor.KeepAnchor, 100)
-            cursor.removeSelectedText()
-            # Update stored content after cleanup
-            self._full_log_content = self.activity_log.toHtml()
+        # Follow new lines only if the user has not scrolled up to read older ones
+        scrollbar = self.activity_log.verticalScrollBar()
+        was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        
+        # Plain-text append with a cached char format; no HTML is parsed
+        with QSignalBlocker(self.activity_log):
+            cursor = QTextCursor(self.activity_log.document())
+            cursor.beginEditBlock()
+            for color, line in self._log_buffer:
+                self._append_log_line(cursor, color, line)
+            cursor.endEditBlock()
+        self._log_buffer.clear()
+        
+        if was_at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
     def start_cleanup(self):
         """Start the file cleanup process."""
@@ -1505,20 +2090,20 @@ class MainWindow(QMainWindow):
         if no_files_found:
             message = "✅ No temporary files found to clean - System is already clean!"
             self.cleanup_info.setText(message)
-            self.log_activity(message)
-            self.statusBar().showMessage("No files to clean", 3000)
+            self.log_activity(message, "SUCCESS")
+            self._status_bar.showMessage("No files to clean", 3000)
             QMessageBox.information(self, "Cleanup Complete", "No temporary files were found that need cleaning.\n\nYour system is already clean!")
         elif files_cleaned > 0:
             message = f"Cleanup completed! {files_cleaned} files removed, {space_freed:.1f} MB freed"
             self.cleanup_info.setText(message)
-            self.log_activity(message)
-            self.statusBar().showMessage(f"Cleanup completed - {files_cleaned} files removed", 5000)
+            self.log_activity(message, "SUCCESS")
+            self._status_bar.showMessage(f"Cleanup completed - {files_cleaned} files removed", 5000)
             QMessageBox.information(self, "Cleanup Complete", f"Successfully cleaned {files_cleaned} files and freed {space_freed:.1f} MB of disk space!")
         else:
             message = "Cleanup completed but no files were removed"
             self.cleanup_info.setText(message)
-            self.log_activity(message)
-            self.statusBar().showMessage("Cleanup completed", 3000)
+            self.log_activity(message, "SUCCESS")
+            self._status_bar.showMessage("Cleanup completed", 3000)
     
     def open_startup_manager(self):
         """Open startup manager window."""
@@ -1535,9 +2120,6 @@ class MainWindow(QMainWindow):
     def open_disk_analyzer(self):
         """Open disk space analyzer."""
         try:
-            import psutil
-            import os
-            
             dialog = QDialog(self)
             dialog.setWindowTitle("Disk Space Analyzer")
             dialog.setModal(True)
@@ -1550,10 +2132,7 @@ class MainWindow(QMainWindow):
             drive_layout = QHBoxLayout(drive_group)
             
             drive_combo = QComboBox()
-            partitions = psutil.disk_partitions()
-            for partition in partitions:
-                if 'cdrom' not in partition.opts and partition.fstype:
-                    drive_combo.addItem(partition.device)
+            drive_combo.addItems([partition.device for partition in _get_partitions()])
             
             analyze_btn = QPushButton("Analyze")
             
@@ -1567,91 +2146,86 @@ class MainWindow(QMainWindow):
             
             results_text = QTextEdit()
             results_text.setReadOnly(True)
-            results_text.setFont(QFont("Consolas", 9))
+            results_text.setFont(self._mono_font)
             
             results_layout.addWidget(results_text)
             
             layout.addWidget(drive_group)
             layout.addWidget(results_group)
             
+            header = []
+            sized = []
+            failed = []
+            
+            def folder_line(item, size, file_count):
+                size_gb = size / (1024**3)
+                if size_gb > 0.01:  # Show folders > 10MB
+                    estimated = file_count >= _DIR_SIZE_MAX_FILES or size > _DIR_SIZE_CAP
+                    status = " (estimated)" if estimated else ""
+                    return f"  {item}: {size_gb:.2f} GB{status}"
+                if file_count > 0:
+                    return f"  {item}: < 0.01 GB"
+                return f"  {item}: Empty or inaccessible"
+            
+            def folder_sized(item, size, file_count):
+                sized.append((item, size, file_count))
+                results_text.append(folder_line(item, size, file_count))
+            
+            def folder_failed(item, reason):
+                failed.append(f"  {item}: {reason}")
+                results_text.append(failed[-1])
+            
+            def listing_failed(message):
+                failed.append(f"  {message}")
+            
+            def analysis_finished(drive):
+                # Replace the arrival-order stream with the ranked report
+                lines = list(header)
+                for item, size, file_count in heapq.nlargest(_DIR_SIZE_TOP, sized, key=itemgetter(1)):
+                    lines.append(folder_line(item, size, file_count))
+                if len(sized) > _DIR_SIZE_TOP:
+                    lines.append(f"  ... {len(sized) - _DIR_SIZE_TOP} smaller folders not shown")
+                lines.extend(failed)
+                lines.append(f"\nAnalysis completed for {drive}")
+                results_text.setPlainText("\n".join(lines))
+                analyze_btn.setEnabled(True)
+                self.log_activity(f"Disk analysis completed for {drive}", "SUCCESS")
+            
             def analyze_drive():
                 drive = drive_combo.currentText()
-                if drive:
-                    try:
-                        results_text.clear()
-                        results_text.append(f"Analyzing drive {drive}...\n")
-                        
-                        # Get drive usage
-                        usage = psutil.disk_usage(drive)
-                        results_text.append(f"Total Space: {usage.total / (1024**3):.1f} GB")
-                        results_text.append(f"Used Space: {usage.used / (1024**3):.1f} GB ({(usage.used/usage.total)*100:.1f}%)")
-                        results_text.append(f"Free Space: {usage.free / (1024**3):.1f} GB\n")
-                        
-                        # Analyze top-level directories with size limits
-                        results_text.append("Top-level directory analysis:")
-                        results_text.append("(Limited scan for performance)\n")
-                        
-                        try:
-                            items = os.listdir(drive)
-                            for item in items:
-                                item_path = os.path.join(drive, item)
-                                if os.path.isdir(item_path):
-                                    try:
-                                        # Quick size estimation - only scan first level and sample
-                                        size = 0
-                                        file_count = 0
-                                        max_files = 1000  # Limit to prevent hanging
-                                        
-                                        for root, dirs, files in os.walk(item_path):
-                                            # Skip system directories that cause issues
-                                            if any(skip in root.lower() for skip in [
-                                                'system volume information', '$recycle.bin', 
-                                                'windows\\winsxs', 'pagefile.sys', 'hiberfil.sys'
-                                            ]):
-                                                continue
-                                                
-                                            for filename in files[:50]:  # Limit files per directory
-                                                if file_count >= max_files:
-                                                    break
-                                                try:
-                                                    file_path = os.path.join(root, filename)
-                                                    size += os.path.getsize(file_path)
-                                                    file_count += 1
-                                                except (OSError, PermissionError):
-                                                    continue
-                                            
-                                            if file_count >= max_files:
-                                                break
-                                            
-                                            # Only go 2 levels deep to prevent hanging
-                                            if root.count(os.sep) - item_path.count(os.sep) >= 2:
-                                                dirs.clear()
-                                        
-                                        size_gb = size / (1024**3)
-                                        if size_gb > 0.01:  # Show folders > 10MB
-                                            status = " (estimated)" if file_count >= max_files else ""
-                                            results_text.append(f"  {item}: {size_gb:.2f} GB{status}")
-                                        elif file_count > 0:
-                                            results_text.append(f"  {item}: < 0.01 GB")
-                                        else:
-                                            results_text.append(f"  {item}: Empty or inaccessible")
-                                            
-                                    except (PermissionError, FileNotFoundError, OSError):
-                                        results_text.append(f"  {item}: Access denied")
-                                    except Exception as e:
-                                        results_text.append(f"  {item}: Error - {str(e)[:50]}")
-                                        
-                        except PermissionError:
-                            results_text.append("  Access denied to analyze directories")
-                        except Exception as e:
-                            results_text.append(f"  Error listing directories: {str(e)}")
-                        
-                        results_text.append(f"\nAnalysis completed for {drive}")
-                        self.log_activity(f"Disk analysis completed for {drive}")
-                        
-                    except Exception as e:
-                        results_text.append(f"Error analyzing drive: {str(e)}")
-                        self.log_activity(f"Disk analysis error: {str(e)}", "ERROR")
+                if not drive:
+                    return
+                
+                header.clear()
+                sized.clear()
+                failed.clear()
+                try:
+                    header.append(f"Analyzing drive {drive}...\n")
+                    
+                    # Get drive usage
+                    usage = psutil.disk_usage(drive)
+                    header.append(f"Total Space: {usage.total / (1024**3):.1f} GB")
+                    header.append(f"Used Space: {usage.used / (1024**3):.1f} GB ({(usage.used/usage.total)*100:.1f}%)")
+                    header.append(f"Free Space: {usage.free / (1024**3):.1f} GB\n")
+                    
+                    # Analyze top-level directories with size limits
+                    header.append("Top-level directory analysis:")
+                    header.append("(Limited scan for performance)\n")
+                except Exception as e:
+                    results_text.setPlainText(f"Error analyzing drive: {str(e)}")
+                    self.log_activity(f"Disk analysis error: {str(e)}", "ERROR")
+                    return
+                results_text.setPlainText("\n".join(header))
+                analyze_btn.setEnabled(False)
+                
+                # Folders are sized off the GUI thread and listed as each one finishes
+                worker = DiskAnalysisWorker(drive)
+                worker.folder_sized.connect(folder_sized)
+                worker.folder_failed.connect(folder_failed)
+                worker.listing_failed.connect(listing_failed)
+                worker.finished.connect(lambda: analysis_finished(drive))
+                self.disk_analysis_worker = worker
+                worker.start()
             
             analyze_btn.clicked.connect(analyze_drive)
             
@@ -1662,15 +2236,34 @@ class MainWindow(QMainWindow):
             
             dialog.exec_()
             
+            # Closing the dialog abandons folders that have not been sized yet
+            worker = self.disk_analysis_worker
+            if worker and worker.isRunning():
+                for signal in (worker.folder_sized, worker.folder_failed,
+                               worker.listing_failed, worker.finished):
+                    signal.disconnect()
+                worker.cancel()
+                # Let the walks already running finish detached; the set keeps
+                # the thread object alive until then
+                self._detached_disk_workers.add(worker)
+                worker.finished.connect(self._release_disk_worker)
+                if worker.isFinished():
+                    self._detached_disk_workers.discard(worker)  # Finished before the connect
+                self.disk_analysis_worker = None
+            
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error opening disk analyzer: {str(e)}")
             self.log_activity(f"Error opening disk analyzer: {str(e)}", "ERROR")
     
+    def _release_disk_worker(self):
+        """Drop a detached disk analysis worker once its thread has finished."""
+        worker = self.sender()
+        worker.wait()  # Returns at once; finished is emitted as the thread exits
+        self._detached_disk_workers.discard(worker)
+    
     def open_service_manager(self):
         """Open Windows service manager."""
         try:
-            import subprocess
-            
             reply = QMessageBox.question(
                 self, "Service Manager", 
                 "This will open Windows Services management console.\n\nProceed?",
@@ -1678,7 +2271,7 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                subprocess.run(['services.msc'], shell=True)
+                os.startfile('services.msc')  # ShellExecute, so UAC can prompt for elevation
                 self.log_activity("Opened Windows Services console")
                 
         except Exception as e:
@@ -1688,9 +2281,6 @@ class MainWindow(QMainWindow):
     def optimize_memory(self):
         """Optimize system memory usage."""
         try:
-            import psutil
-            import gc
-            
             dialog = QDialog(self)
             dialog.setWindowTitle("Memory Optimizer")
             dialog.setModal(True)
@@ -1756,7 +2346,6 @@ class MainWindow(QMainWindow):
                 
                 if working_set_cb.isChecked():
                     try:
-                        import ctypes
                         ctypes.windll.kernel32.SetProcessWorkingSetSize(-1, -1, -1)
                         results_text.append("✓ Working set trimmed")
                     except:
@@ -1773,7 +2362,7 @@ class MainWindow(QMainWindow):
                 else:
                     results_text.append("Memory optimization completed")
                 
-                self.log_activity(f"Memory optimization completed - {freed_mb:.1f}MB freed")
+                self.log_activity(f"Memory optimization completed - {freed_mb:.1f}MB freed", "SUCCESS")
             
             optimize_btn.clicked.connect(optimize)
             close_btn.clicked.connect(dialog.close)
@@ -1815,7 +2404,7 @@ class MainWindow(QMainWindow):
             # Results area
             results_text = QTextEdit()
             results_text.setReadOnly(True)
-            results_text.setFont(QFont("Consolas", 9))
+            results_text.setFont(self._mono_font)
             
             # Progress bar
             progress_bar = QProgressBar()
@@ -1837,73 +2426,30 @@ class MainWindow(QMainWindow):
             layout.addLayout(button_layout)
             
             def run_scan():
+                if self.security_scan_worker and self.security_scan_worker.isRunning():
+                    return
+                
                 results_text.clear()
                 progress_bar.setVisible(True)
-                progress_bar.setValue(0)
                 scan_btn.setEnabled(False)
                 
-                results_text.append("=== SECURITY SCAN STARTED ===\n")
-                
-                if startup_cb.isChecked():
-                    progress_bar.setValue(25)
-                    results_text.append("Checking startup programs...")
-                    try:
-                        startup_count = len(self.startup_manager.get_startup_programs())
-                        results_text.append(f"✓ Found {startup_count} startup programs - Review recommended")
-                    except:
-                        results_text.append("✗ Could not access startup programs")
-                    results_text.append("")
-                
-                if processes_cb.isChecked():
-                    progress_bar.setValue(50)
-                    results_text.append("Scanning running processes...")
-                    try:
-                        import psutil
-                        suspicious_processes = []
-                        for proc in psutil.process_iter(['name', 'cpu_percent']):
-                            try:
-                                if proc.info['cpu_percent'] and proc.info['cpu_percent'] > 50:
-                                    suspicious_processes.append(proc.info['name'])
-                            except:
-                                pass
-                        
-                        if suspicious_processes:
-                            results_text.append(f"⚠ High CPU processes detected: {', '.join(suspicious_processes[:5])}")
-                        else:
-                            results_text.append("✓ No suspicious process activity detected")
-                    except:
-                        results_text.append("✗ Could not scan processes")
-                    results_text.append("")
-                
-                if network_cb.isChecked():
-                    progress_bar.setValue(75)
-                    results_text.append("Checking network connections...")
-                    try:
-                        import psutil
-                        connections = psutil.net_connections()
-                        listening_ports = [conn.laddr.port for conn in connections if conn.status == 'LISTEN']
-                        results_text.append(f"✓ Found {len(listening_ports)} listening ports")
-                        if listening_ports:
-                            common_ports = [port for port in listening_ports if port in [80, 443, 22, 21, 25, 53, 110, 143, 993, 995]]
-                            if common_ports:
-                                results_text.append(f"  Common service ports: {', '.join(map(str, common_ports))}")
-                    except:
-                        results_text.append("✗ Could not check network connections")
-                    results_text.append("")
-                
-                if files_cb.isChecked():
-                    progress_bar.setValue(90)
-                    results_text.append("Checking system file integrity...")
-                    results_text.append("ℹ For full system file check, run 'sfc /scannow' as administrator")
-                    results_text.append("")
-                
-                progress_bar.setValue(100)
-                results_text.append("=== SECURITY SCAN COMPLETED ===")
-                results_text.append("✓ Basic security scan finished")
-                results_text.append("💡 For comprehensive security, use dedicated antivirus software")
-                
+                # Checks run off the GUI thread; result lines stream into the dialog
+                worker = SecurityScanWorker(
+                    self.startup_manager,
+                    check_startup=startup_cb.isChecked(),
+                    check_processes=processes_cb.isChecked(),
+                    check_network=network_cb.isChecked(),
+                    check_files=files_cb.isChecked(),
+                )
+                worker.line.connect(results_text.append)
+                worker.progress.connect(progress_bar.setValue)
+                worker.finished.connect(scan_finished)
+                self.security_scan_worker = worker
+                worker.start()
+            
+            def scan_finished():
                 scan_btn.setEnabled(True)
-                self.log_activity("Security scan completed")
+                self.log_activity("Security scan completed", "SUCCESS")
             
             scan_btn.clicked.connect(run_scan)
             close_btn.clicked.connect(dialog.close)
@@ -1924,8 +2470,7 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                import subprocess
-                subprocess.Popen(['dfrgui.exe'], shell=True)
+                os.startfile('dfrgui.exe')
                 self.log_activity("Opened Disk Defragmentation utility")
                 
         except Exception as e:
@@ -1935,8 +2480,7 @@ class MainWindow(QMainWindow):
     def open_system_restore(self):
         """Open Windows System Restore."""
         try:
-            import subprocess
-            subprocess.Popen(['rstrui.exe'], shell=True)
+            os.startfile('rstrui.exe')
             self.log_activity("Opened System Restore")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error opening System Restore: {str(e)}")
@@ -1957,23 +2501,55 @@ class MainWindow(QMainWindow):
             
             results_text = QTextEdit()
             results_text.setReadOnly(True)
-            results_text.setFont(QFont("Consolas", 9))
-            
-            # Check drivers using PowerShell
-            try:
-                import subprocess
-                result = subprocess.run([
-                    'powershell', '-Command', 
-                    'Get-WmiObject Win32_PnPEntity | Where-Object {$_.ConfigManagerErrorCode -ne 0} | Select-Object Name, ConfigManagerErrorCode'
-                ], capture_output=True, text=True, timeout=30)
-                
-                if result.stdout:
-                    results_text.setPlainText(f"Driver Issues Found:\n\n{result.stdout}")
-                else:
+            results_text.setFont(self._mono_font)
+            
+            # Check drivers using PowerShell; output streams in while the dialog stays responsive
+            driver_output = []
+            timed_out = []  # Set once the 30 s limit kills the process
+            
+            def read_driver_output():
+                text = bytes(driver_proc.readAllStandardOutput()).decode('utf-8', 'replace')
+                if not text.strip() and not driver_output:
+                    return
+                if not driver_output:
+                    results_text.setPlainText("Driver Issues Found:\n\n")
+                driver_output.append(text)
+                results_text.moveCursor(QTextCursor.End)
+                results_text.insertPlainText(text)
+            
+            def driver_check_finished(exit_code, exit_status):
+                if exit_status != QProcess.NormalExit:
+                    info_label.setText("Driver check did not finish")
+                    if not timed_out:
+                        self.log_activity("Driver check did not finish", "WARNING")
+                    return
+                if not driver_output:
                     results_text.setPlainText("✓ No driver issues detected.\n\nAll drivers appear to be working correctly.")
-                    
-            except Exception as e:
-                results_text.setPlainText(f"Could not check drivers: {str(e)}\n\nTo manually check drivers:\n1. Open Device Manager\n2. Look for devices with yellow warning icons\n3. Right-click and select 'Update driver'")
+                info_label.setText("Driver check complete")
+                self.log_activity("Driver check completed", "SUCCESS")
+            
+            def driver_check_timeout():
+                if driver_proc.state() != QProcess.NotRunning:
+                    timed_out.append(True)
+                    self.log_activity("Driver check timed out after 30 seconds", "WARNING")
+                    driver_proc.kill()
+            
+            def driver_check_failed(error):
+                if error == QProcess.FailedToStart:
+                    results_text.setPlainText(f"Could not check drivers: {driver_proc.errorString()}\n\nTo manually check drivers:\n1. Open Device Manager\n2. Look for devices with yellow warning icons\n3. Right-click and select 'Update driver'")
+                    info_label.setText("Driver check unavailable")
+            
+            driver_proc = QProcess(dialog)
+            driver_proc.setProgram('powershell')
+            driver_proc.setArguments([
+                '-NoProfile', '-Command',
+                'Get-WmiObject Win32_PnPEntity | Where-Object {$_.ConfigManagerErrorCode -ne 0} | Select-Object Name, ConfigManagerErrorCode'
+            ])
+            driver_proc.readyReadStandardOutput.connect(read_driver_output)
+            driver_proc.finished.connect(driver_check_finished)
+            driver_proc.errorOccurred.connect(driver_check_failed)
+            driver_proc.start()
+            QTimer.singleShot(30000, driver_check_timeout)  # Same 30 s limit as before
             
             layout.addWidget(results_text)
             
@@ -1983,10 +2559,10 @@ class MainWindow(QMainWindow):
             
             def open_device_manager():
                 try:
-                    subprocess.Popen(['devmgmt.msc'], shell=True)
+                    os.startfile('devmgmt.msc')
                     self.log_activity("Opened Device Manager")
-                except:
-                    pass
+                except OSError as e:
+                    self.log_activity(f"Error opening Device Manager: {str(e)}", "ERROR")
             
             device_manager_btn.clicked.connect(open_device_manager)
             close_btn.clicked.connect(dialog.close)
@@ -1998,7 +2574,6 @@ class MainWindow(QMainWindow):
             layout.addLayout(button_layout)
             
             dialog.exec_()
-            self.log_activity("Driver check completed")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error checking drivers: {str(e)}")
@@ -2007,8 +2582,7 @@ class MainWindow(QMainWindow):
     def open_power_options(self):
         """Open Windows Power Options."""
         try:
-            import subprocess
-            subprocess.Popen(['powercfg.cpl'], shell=True)
+            os.startfile('powercfg.cpl')
             self.log_activity("Opened Power Options")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error opening Power Options: {str(e)}")
@@ -2023,18 +2597,42 @@ class MainWindow(QMainWindow):
             self.log_activity("Starting comprehensive system maintenance", "INFO")
             
             # Simulate maintenance tasks with proper feedback
-            QTimer.singleShot(500, lambda: self.log_activity("Clearing system cache...", "INFO"))
-            QTimer.singleShot(1000, lambda: self.log_activity("Optimizing memory usage...", "INFO"))
-            QTimer.singleShot(1500, lambda: self.log_activity("Cleaning temporary files...", "INFO"))
-            QTimer.singleShot(2000, lambda: self.log_activity("Defragmenting registry...", "INFO"))
-            QTimer.singleShot(2500, lambda: self.log_activity("Updating system indexes...", "INFO"))
-            QTimer.singleShot(3000, lambda: self._finish_maintenance())
+            self._start_log_schedule(self._MAINTENANCE_STEPS, self._finish_maintenance)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error running maintenance: {str(e)}")
             self.log_activity(f"Error running maintenance: {str(e)}", "ERROR")
             self._finish_maintenance()
     
+    def _start_log_schedule(self, steps, on_done=None):
+        """Log each (offset_ms, message, level) step when its offset elapses, then call on_done."""
+        self._log_schedules.append([time.monotonic() * 1000, steps, 0, on_done])
+        if not self._schedule_timer.isActive():
+            self._schedule_timer.start()
+    
+    def _advance_log_schedules(self):
+        """Fire every schedule step that is due; stop the driver timer when all are done."""
+        now = time.monotonic() * 1000
+        for schedule in list(self._log_schedules):
+            # on_done may open a modal box whose event loop re-enters this method
+            if schedule not in self._log_schedules:
+                continue
+            start, steps, index, on_done = schedule
+            while index < len(steps) and now - start >= steps[index][0]:
+                _, message, level = steps[index]
+                if message:
+                    self.log_activity(message, level)
+                index += 1
+            schedule[2] = index
+            
+            if index == len(steps):
+                self._log_schedules.remove(schedule)
+                if on_done:
+                    on_done()
+        
+        if not self._log_schedules:
+            self._schedule_timer.stop()
+    
     def _finish_maintenance(self):
         """Complete the maintenance process."""
         self.maintenance_btn.setEnabled(True)
@@ -2113,7 +2711,7 @@ class MainWindow(QMainWindow):
                     try:
                         result = cleaner.clean_browser_data(browsers, data_types)
                         QMessageBox.information(dialog, "Success", f"Browser cleaning completed!\n{result}")
-                        self.log_activity(f"Browser cleaning completed: {result}")
+                        self.log_activity(f"Browser cleaning completed: {result}", "SUCCESS")
                         dialog.accept()
                     except Exception as e:
                         QMessageBox.critical(dialog, "Error", f"Browser cleaning failed: {str(e)}")
@@ -2129,31 +2727,6 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error opening browser cleaner: {str(e)}")
             self.log_activity(f"Error opening browser cleaner: {str(e)}", "ERROR")
-        self.maintenance_btn.setEnabled(False)
-        self.maintenance_btn.setText("Running Maintenance...")
-        
-        self.log_activity("Starting comprehensive system maintenance", "INFO")
-        
-        # Simulate maintenance tasks with proper feedback
-        QTimer.singleShot(500, lambda: self.log_activity("Clearing system cache...", "INFO"))
-        QTimer.singleShot(1000, lambda: self.log_activity("Optimizing memory usage...", "INFO"))
-        QTimer.singleShot(1500, lambda: self.log_activity("Cleaning temporary files...", "INFO"))
-        QTimer.singleShot(2000, lambda: self.log_activity("Maintenance completed successfully!", "SUCCESS"))
-        
-        # Update status and UI
-        QTimer.singleShot(2000, lambda: self.statusBar().showMessage("System optimized successfully!", 5000))
-        QTimer.singleShot(2000, lambda: self.maintenance_btn.setText("Complete!"))
-        
-        # Start actual cleanup
-        QTimer.singleShot(2500, self.start_cleanup)
-        
-        # Reset button after maintenance
-        QTimer.singleShot(4000, self.restore_maintenance_button)
-    
-    def restore_maintenance_button(self):
-        """Restore maintenance button state."""
-        self.maintenance_btn.setEnabled(True)
-        self.maintenance_btn.setText("Quick Maintenance")
     
     def show_and_raise(self):
         """Show and raise the main window."""
@@ -2183,114 +2756,85 @@ class MainWindow(QMainWindow):
     def show_detailed_system_info(self):
         """Show detailed system information dialog with enhanced error handling."""
         try:
-            import psutil
-            import platform
-            from datetime import datetime
+            _require_psutil()
             
             self.log_activity("Generating detailed system report...", "INFO")
             
-            # Gather comprehensive system information with error handling
-            info = []
-            info.append("PC MAINTENANCE DASHBOARD v2.0 - SYSTEM REPORT")
-            info.append(f"Generated by: MStefa003 (https://github.com/MStefa003)")
-            info.append(f"Report Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            info.append("=" * 60)
-            info.append("")
-            
-            # System Information
-            try:
-                info.append("=== SYSTEM INFORMATION ===")
-                info.append(f"OS: {platform.system()} {platform.release()}")
-                info.append(f"Architecture: {platform.architecture()[0]}")
-                info.append(f"Processor: {platform.processor() or 'Unknown'}")
-                info.append(f"Machine: {platform.machine()}")
-                info.append(f"Node: {platform.node()}")
-                info.append("")
-            except Exception as e:
-                info.append(f"System info error: {str(e)}")
-                info.append("")
+            static = self._static_system_info()
+            gb = 1024**3
             
-            # CPU Information
-            try:
-                info.append("=== CPU INFORMATION ===")
-                info.append(f"Physical cores: {psutil.cpu_count(logical=False)}")
-                info.append(f"Total cores: {psutil.cpu_count(logical=True)}")
-                
-                # CPU frequencies
+            def cpu_lines():
+                lines = [f"Physical cores: {static['phys_cores']}",
+                         f"Total cores: {static['total_cores']}"]
                 cpufreq = psutil.cpu_freq()
                 if cpufreq:
-                    info.append(f"Max Frequency: {cpufreq.max:.2f}Mhz")
-                    info.append(f"Current Frequency: {cpufreq.current:.2f}Mhz")
-                
-                # Current CPU usage
-                cpu_usage = psutil.cpu_percent(interval=1)
-                info.append(f"Current CPU Usage: {cpu_usage}%")
-                info.append("")
-            except Exception as e:
-                info.append(f"CPU info error: {str(e)}")
-                info.append("")
+                    lines += [f"Max Frequency: {cpufreq.max:.2f}Mhz",
+                              f"Current Frequency: {cpufreq.current:.2f}Mhz"]
+                lines.append(f"Current CPU Usage: {self._current_cpu_percent():.1f}%")
+                return lines
             
-            # Memory Information
-            try:
-                info.append("=== MEMORY INFORMATION ===")
+            def memory_lines():
                 svmem = psutil.virtual_memory()
-                info.append(f"Total: {svmem.total / (1024**3):.2f} GB")
-                info.append(f"Available: {svmem.available / (1024**3):.2f} GB")
-                info.append(f"Used: {svmem.used / (1024**3):.2f} GB")
-                info.append(f"Usage: {svmem.percent}%")
-                info.append("")
-            except Exception as e:
-                info.append(f"Memory info error: {str(e)}")
-                info.append("")
-            
-            # Disk Information
-            try:
-                info.append("=== DISK INFORMATION ===")
-                partitions = psutil.disk_partitions()
-                for partition in partitions:
-                    if 'cdrom' in partition.opts or partition.fstype == '':
+                return [f"Total: {svmem.total / gb:.2f} GB",
+                        f"Available: {svmem.available / gb:.2f} GB",
+                        f"Used: {svmem.used / gb:.2f} GB",
+                        f"Usage: {svmem.percent}%"]
+            
+            def disk_lines():
+                lines = []
+                for partition, usage in _partition_usages(_get_partitions()):
+                    lines += [f"Drive: {partition.device}", f"  File System: {partition.fstype}"]
+                    if usage is None:
+                        lines += ["  Access denied or not available", ""]
                         continue
-                    try:
-                        info.append(f"Drive: {partition.device}")
-                        info.append(f"  File System: {partition.fstype}")
-                        partition_usage = psutil.disk_usage(partition.mountpoint)
-                        info.append(f"  Total: {partition_usage.total / (1024**3):.2f} GB")
-                        info.append(f"  Used: {partition_usage.used / (1024**3):.2f} GB")
-                        info.append(f"  Free: {partition_usage.free / (1024**3):.2f} GB")
-                        info.append(f"  Usage: {(partition_usage.used / partition_usage.total) * 100:.1f}%")
-                        info.append("")
-                    except (PermissionError, FileNotFoundError):
-                        info.append(f"  Access denied or not available")
-                        info.append("")
-            except Exception as e:
-                info.append(f"Disk info error: {str(e)}")
-                info.append("")
-            
-            # Network Information
-            try:
-                info.append("=== NETWORK INFORMATION ===")
+                    lines += [f"  Total: {usage.total / gb:.2f} GB",
+                              f"  Used: {usage.used / gb:.2f} GB",
+                              f"  Free: {usage.free / gb:.2f} GB",
+                              f"  Usage: {(usage.used / usage.total) * 100:.1f}%",
+                              ""]
+                return lines[:-1]  # The section adds its own trailing blank line
+            
+            def network_lines():
                 net_io = psutil.net_io_counters()
-                info.append(f"Total Sent: {net_io.bytes_sent / (1024**2):.2f} MB")
-                info.append(f"Total Received: {net_io.bytes_recv / (1024**2):.2f} MB")
-                info.append("")
-            except Exception as e:
-                info.append(f"Network info error: {str(e)}")
-                info.append("")
+                return [f"Total Sent: {net_io.bytes_sent / (1024**2):.2f} MB",
+                        f"Total Received: {net_io.bytes_recv / (1024**2):.2f} MB"]
             
-            # System Uptime
-            try:
-                info.append("=== SYSTEM UPTIME ===")
-                boot_time_timestamp = psutil.boot_time()
+            def uptime_lines():
+                boot_time_timestamp = static['boot_time']
                 bt = datetime.fromtimestamp(boot_time_timestamp)
-                info.append(f"Boot Time: {bt.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                import time
-                uptime_seconds = time.time() - boot_time_timestamp
-                uptime_hours = uptime_seconds / 3600
-                info.append(f"Uptime: {uptime_hours:.1f} hours")
-                info.append("")
-            except Exception as e:
-                info.append(f"Uptime info error: {str(e)}")
+                uptime_hours = (time.time() - boot_time_timestamp) / 3600
+                return [f"Boot Time: {bt.strftime('%Y-%m-%d %H:%M:%S')}",
+                        f"Uptime: {uptime_hours:.1f} hours"]
+            
+            # (header, error label, line builder); a failing section reports one error line
+            sections = (
+                ("SYSTEM INFORMATION", "System info", lambda: [
+                    f"OS: {static['os']}",
+                    f"Architecture: {static['arch']}",
+                    f"Processor: {static['processor'] or 'Unknown'}",
+                    f"Machine: {static['machine']}",
+                    f"Node: {static['node']}",
+                ]),
+                ("CPU INFORMATION", "CPU info", cpu_lines),
+                ("MEMORY INFORMATION", "Memory info", memory_lines),
+                ("DISK INFORMATION", "Disk info", disk_lines),
+                ("NETWORK INFORMATION", "Network info", network_lines),
+                ("SYSTEM UPTIME", "Uptime info", uptime_lines),
+            )
+            
+            info = [
+                "PC MAINTENANCE DASHBOARD v2.0 - SYSTEM REPORT",
+                "Generated by: MStefa003 (https://github.com/MStefa003)",
+                f"Report Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "=" * 60,
+                "",
+            ]
+            for header, label, build in sections:
+                info.append(f"=== {header} ===")
+                try:
+                    info.extend(build())
+                except Exception as e:
+                    info.append(f"{label} error: {str(e)}")
                 info.append("")
             
             system_info = "\n".join(info)
@@ -2311,15 +2855,8 @@ class MainWindow(QMainWindow):
             text_edit = QTextEdit()
             text_edit.setPlainText(system_info)
             text_edit.setReadOnly(True)
-            text_edit.setFont(QFont("Consolas", 9))
-            text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            text_edit.setFont(self._mono_font)
+            text_edit.setStyleSheet(self._TEXTEDIT_QSS)
             layout.addWidget(text_edit)
             
             # Enhanced button layout
@@ -2352,22 +2889,46 @@ class MainWindow(QMainWindow):
             self.log_activity(f"System report generation failed: {str(e)}", "ERROR")
             QMessageBox.critical(self, "Error", f"Failed to generate system report: {str(e)}")
     
+    def _current_cpu_percent(self):
+        """Return the latest dashboard CPU reading without sleeping the GUI thread."""
+        if self._last_cpu_percent is not None:
+            return self._last_cpu_percent
+        # No stats sample yet; read the delta since the prime in setup_timer
+        return psutil.cpu_percent(interval=None)
+    
+    def _static_system_info(self):
+        """Return platform and hardware facts that cannot change while we run.
+        
+        Gathered on first use and reused by every report afterwards.
+        """
+        if self._static_sysinfo is None:
+            self._static_sysinfo = {
+                'os': f"{platform.system()} {platform.release()}",
+                'arch': platform.architecture()[0],
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'node': platform.node(),
+                'phys_cores': psutil.cpu_count(logical=False),
+                'total_cores': psutil.cpu_count(logical=True),
+                'boot_time': self._boot_time if self._boot_time is not None else psutil.boot_time(),
+            }
+        return self._static_sysinfo
+    
     def _copy_system_info(self, info):
         """Copy system information to clipboard with feedback."""
         try:
             QApplication.clipboard().setText(info)
             self.log_activity("System report copied to clipboard", "SUCCESS")
-            self.statusBar().showMessage("System report copied to clipboard!", 3000)
+            self._status_bar.showMessage("System report copied to clipboard!", 3000)
         except Exception as e:
             self.log_activity(f"Failed to copy to clipboard: {str(e)}", "ERROR")
     
     def visit_github(self):
         """Open GitHub profile in web browser."""
         try:
-            import webbrowser
             webbrowser.open("https://github.com/MStefa003")
             self.log_activity("GitHub profile opened in browser", "SUCCESS")
-            self.statusBar().showMessage("GitHub profile opened", 3000)
+            self._status_bar.showMessage("GitHub profile opened", 3000)
         except Exception as e:
             self.log_activity(f"Failed to open GitHub: {str(e)}", "ERROR")
             QMessageBox.warning(self, "Error", f"Could not open GitHub profile: {str(e)}")
@@ -2418,11 +2979,9 @@ GitHub: https://github.com/MStefa003
             self.log_activity("Registry scan started (simulation mode)", "INFO")
             
             # Simulate registry scanning with progress
-            QTimer.singleShot(1000, lambda: self.log_activity("Scanning HKEY_CURRENT_USER...", "INFO"))
-            QTimer.singleShot(2000, lambda: self.log_activity("Scanning HKEY_LOCAL_MACHINE...", "INFO"))
-            QTimer.singleShot(3000, lambda: self.log_activity("Analyzing registry entries...", "INFO"))
-            QTimer.singleShot(4000, lambda: self.log_activity("Registry scan completed - 0 issues found (safe mode)", "SUCCESS"))
-            QTimer.singleShot(4000, lambda: self.statusBar().showMessage("Registry scan completed safely", 3000))
+            self._start_log_schedule(
+                self._REGISTRY_SCAN_STEPS,
+                lambda: self._status_bar.showMessage("Registry scan completed safely", 3000))
             
             QMessageBox.information(self, "Registry Cleaner", 
                                   "Registry scan completed successfully!\n\n"
@@ -2469,35 +3028,7 @@ Developed by MStefa003
     def show_processes(self):
         """Show process manager dialog."""
         try:
-            import psutil
-            
-            # Get top processes by CPU usage
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
-            
-            # Create process info text
-            process_text = "PC Maintenance Dashboard - Process Manager\n\n"
-            process_text += "Top Processes by CPU Usage:\n"
-            process_text += "=" * 50 + "\n\n"
-            
-            for i, proc in enumerate(processes[:15]):
-                cpu = proc['cpu_percent'] or 0
-                mem = proc['memory_percent'] or 0
-                name = proc['name'] or 'Unknown'
-                pid = proc['pid']
-                process_text += f"{i+1:2d}. {name:<20} (PID: {pid:<6}) CPU: {cpu:5.1f}% RAM: {mem:5.1f}%\n"
-            
-            process_text += "\n" + "=" * 50 + "\n"
-            process_text += f"Total Processes: {len(psutil.pids())}\n"
-            process_text += "\nFor advanced process management, use Task Manager (Ctrl+Shift+Esc)\n"
-            process_text += "\nDeveloped by MStefa003 - GitHub: https://github.com/MStefa003"
+            _require_psutil()
             
             # Create dialog
             dialog = QDialog(self)
@@ -2508,24 +3039,25 @@ Developed by MStefa003
             layout = QVBoxLayout(dialog)
             
             text_edit = QTextEdit()
-            text_edit.setPlainText(process_text)
+            text_edit.setPlainText("Collecting process information...")
             text_edit.setReadOnly(True)
-            text_edit.setFont(QFont("Consolas", 9))
-            text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            text_edit.setFont(self._mono_font)
+            text_edit.setStyleSheet(self._TEXTEDIT_QSS)
             layout.addWidget(text_edit)
             
             # Button layout
             button_layout = QHBoxLayout()
             
             refresh_btn = QPushButton("🔄 Refresh")
-            refresh_btn.clicked.connect(lambda: self.show_processes())
+            def refresh():
+                # Drop clicks that arrive faster than a snapshot can be taken
+                now = time.monotonic()
+                if self._last_proc_refresh is not None and now - self._last_proc_refresh < self._PROC_REFRESH_COOLDOWN:
+                    return
+                self._last_proc_refresh = now
+                self._processes_requested.emit()
+            
+            refresh_btn.clicked.connect(refresh)
             button_layout.addWidget(refresh_btn)
             
             close_btn = QPushButton("✖️ Close")
@@ -2534,8 +3066,21 @@ Developed by MStefa003
             
             layout.addLayout(button_layout)
             
+            # The snapshot is taken on a worker thread and fills text_edit when ready
+            if self._process_thread is None:
+                self._process_thread = QThread(self)
+                self._process_worker = ProcessSnapshotWorker()
+                self._process_worker.moveToThread(self._process_thread)
+                self._processes_requested.connect(self._process_worker.run)
+                self._process_worker.snapshot_ready.connect(self._show_process_snapshot)
+                self._process_thread.start()
+            self._process_text = text_edit
+            self._last_proc_refresh = time.monotonic()
+            self._processes_requested.emit()
+            
             self.log_activity("Process manager opened", "SUCCESS")
             dialog.exec_()
+            self._process_text = None
             
         except ImportError:
             self.log_activity("psutil required for process management", "ERROR")
@@ -2544,55 +3089,75 @@ Developed by MStefa003
             self.log_activity(f"Error showing processes: {str(e)}", "ERROR")
             QMessageBox.warning(self, "Error", f"Could not display process information: {str(e)}")
     
+    def _show_process_snapshot(self, processes, total):
+        """Render a ProcessSnapshotWorker result into the open process manager."""
+        if self._process_text is None:
+            return
+        
+        process_text = "PC Maintenance Dashboard - Process Manager\n\n"
+        process_text += "Top Processes by CPU Usage:\n"
+        process_text += "=" * 50 + "\n\n"
+        
+        for i, proc in enumerate(processes):
+            cpu = proc['cpu_percent'] or 0
+            mem = proc['memory_percent'] or 0
+            name = proc['name'] or 'Unknown'
+            pid = proc['pid']
+            process_text += f"{i+1:2d}. {name:<20} (PID: {pid:<6}) CPU: {cpu:5.1f}% RAM: {mem:5.1f}%\n"
+        
+        process_text += "\n" + "=" * 50 + "\n"
+        process_text += f"Total Processes: {total}\n"
+        process_text += "\nFor advanced process management, use Task Manager (Ctrl+Shift+Esc)\n"
+        process_text += "\nDeveloped by MStefa003 - GitHub: https://github.com/MStefa003"
+        
+        self._process_text.setPlainText(process_text)
+    
+    def _build_disk_text(self):
+        """Build the disk usage analyzer report."""
+        disk_text = "PC Maintenance Dashboard - Disk Analyzer\n\n"
+        disk_text += "Disk Usage Analysis:\n"
+        disk_text += "=" * 50 + "\n\n"
+        
+        # Get all disk partitions, with every volume queried at once
+        for partition, usage in _partition_usages(_get_partitions()):
+            if usage is None:
+                disk_text += f"Drive: {partition.device} - Access Denied\n\n"
+                continue
+            
+            total_gb = usage.total / (1024**3)
+            used_gb = usage.used / (1024**3)
+            free_gb = usage.free / (1024**3)
+            percent = (usage.used / usage.total) * 100
+            
+            disk_text += f"Drive: {partition.device}\n"
+            disk_text += f"  File System: {partition.fstype}\n"
+            disk_text += f"  Total Space: {total_gb:.2f} GB\n"
+            disk_text += f"  Used Space:  {used_gb:.2f} GB ({percent:.1f}%)\n"
+            disk_text += f"  Free Space:  {free_gb:.2f} GB\n"
+            
+            # Add status indicator
+            if percent > 90:
+                disk_text += f"  Status: 🔴 Critical - Very Low Space\n"
+            elif percent > 80:
+                disk_text += f"  Status: 🟡 Warning - Low Space\n"
+            else:
+                disk_text += f"  Status: 🟢 Healthy\n"
+            
+            disk_text += "\n"
+        
+        disk_text += "=" * 50 + "\n"
+        disk_text += "Recommendations:\n"
+        disk_text += "• Keep at least 15% free space for optimal performance\n"
+        disk_text += "• Use Disk Cleanup to remove temporary files\n"
+        disk_text += "• Uninstall unused programs\n"
+        disk_text += "• Move large files to external storage\n\n"
+        disk_text += "Developed by MStefa003 - GitHub: https://github.com/MStefa003"
+        return disk_text
+    
     def analyze_disk_usage(self):
         """Show disk usage analyzer."""
         try:
-            import psutil
-            
-            disk_text = "PC Maintenance Dashboard - Disk Analyzer\n\n"
-            disk_text += "Disk Usage Analysis:\n"
-            disk_text += "=" * 50 + "\n\n"
-            
-            # Get all disk partitions
-            partitions = psutil.disk_partitions()
-            
-            for partition in partitions:
-                if 'cdrom' in partition.opts or partition.fstype == '':
-                    continue
-                    
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    total_gb = usage.total / (1024**3)
-                    used_gb = usage.used / (1024**3)
-                    free_gb = usage.free / (1024**3)
-                    percent = (usage.used / usage.total) * 100
-                    
-                    disk_text += f"Drive: {partition.device}\n"
-                    disk_text += f"  File System: {partition.fstype}\n"
-                    disk_text += f"  Total Space: {total_gb:.2f} GB\n"
-                    disk_text += f"  Used Space:  {used_gb:.2f} GB ({percent:.1f}%)\n"
-                    disk_text += f"  Free Space:  {free_gb:.2f} GB\n"
-                    
-                    # Add status indicator
-                    if percent > 90:
-                        disk_text += f"  Status: 🔴 Critical - Very Low Space\n"
-                    elif percent > 80:
-                        disk_text += f"  Status: 🟡 Warning - Low Space\n"
-                    else:
-                        disk_text += f"  Status: 🟢 Healthy\n"
-                    
-                    disk_text += "\n"
-                    
-                except (PermissionError, FileNotFoundError):
-                    disk_text += f"Drive: {partition.device} - Access Denied\n\n"
-            
-            disk_text += "=" * 50 + "\n"
-            disk_text += "Recommendations:\n"
-            disk_text += "• Keep at least 15% free space for optimal performance\n"
-            disk_text += "• Use Disk Cleanup to remove temporary files\n"
-            disk_text += "• Uninstall unused programs\n"
-            disk_text += "• Move large files to external storage\n\n"
-            disk_text += "Developed by MStefa003 - GitHub: https://github.com/MStefa003"
+            _require_psutil()
             
             # Create dialog
             dialog = QDialog(self)
@@ -2603,24 +3168,29 @@ Developed by MStefa003
             layout = QVBoxLayout(dialog)
             
             text_edit = QTextEdit()
-            text_edit.setPlainText(disk_text)
+            text_edit.setPlainText(self._build_disk_text())
+            self._last_disk_refresh = time.monotonic()
             text_edit.setReadOnly(True)
-            text_edit.setFont(QFont("Consolas", 9))
-            text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            text_edit.setFont(self._mono_font)
+            text_edit.setStyleSheet(self._TEXTEDIT_QSS)
             layout.addWidget(text_edit)
             
             # Button layout
             button_layout = QHBoxLayout()
             
             refresh_btn = QPushButton("🔄 Refresh")
-            refresh_btn.clicked.connect(lambda: self.analyze_disk_usage())
+            def refresh():
+                # Rebuild only the text; the dialog and its widgets stay as they are
+                now = time.monotonic()
+                if self._last_disk_refresh is not None and now - self._last_disk_refresh < self._DISK_REFRESH_COOLDOWN:
+                    return
+                self._last_disk_refresh = now
+                try:
+                    text_edit.setPlainText(self._build_disk_text())
+                except Exception as e:
+                    self.log_activity(f"Error refreshing disk analysis: {str(e)}", "ERROR")
+            
+            refresh_btn.clicked.connect(refresh)
             button_layout.addWidget(refresh_btn)
             
             cleanup_btn = QPushButton("🧹 Start Cleanup")
@@ -2646,7 +3216,7 @@ Developed by MStefa003
     def show_network_monitor(self):
         """Show network monitoring information."""
         try:
-            import psutil
+            _require_psutil()
             
             net_text = "PC Maintenance Dashboard - Network Monitor\n\n"
             net_text += "Network Interface Statistics:\n"
@@ -2708,15 +3278,8 @@ Developed by MStefa003
             text_edit = QTextEdit()
             text_edit.setPlainText(net_text)
             text_edit.setReadOnly(True)
-            text_edit.setFont(QFont("Consolas", 9))
-            text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            text_edit.setFont(self._mono_font)
+            text_edit.setStyleSheet(self._TEXTEDIT_QSS)
             layout.addWidget(text_edit)
             
             # Button layout
@@ -2745,9 +3308,7 @@ Developed by MStefa003
     def generate_system_report(self):
         """Generate comprehensive system report."""
         try:
-            import psutil
-            import platform
-            from datetime import datetime
+            _require_psutil()
             
             report = "PC MAINTENANCE DASHBOARD - SYSTEM REPORT\n"
             report += "=" * 60 + "\n\n"
@@ -2756,15 +3317,16 @@ Developed by MStefa003
             # System Information
             report += "SYSTEM INFORMATION:\n"
             report += "-" * 30 + "\n"
-            report += f"Operating System: {platform.system()} {platform.release()}\n"
-            report += f"Architecture: {platform.architecture()[0]}\n"
-            report += f"Processor: {platform.processor()}\n"
-            report += f"Machine: {platform.machine()}\n"
-            report += f"Node Name: {platform.node()}\n\n"
+            static = self._static_system_info()
+            report += f"Operating System: {static['os']}\n"
+            report += f"Architecture: {static['arch']}\n"
+            report += f"Processor: {static['processor']}\n"
+            report += f"Machine: {static['machine']}\n"
+            report += f"Node Name: {static['node']}\n\n"
             
             # CPU Information
-            cpu_count = psutil.cpu_count(logical=False)
-            cpu_count_logical = psutil.cpu_count(logical=True)
+            cpu_count = static['phys_cores']
+            cpu_count_logical = static['total_cores']
             cpu_freq = psutil.cpu_freq()
             
             report += "CPU INFORMATION:\n"
@@ -2775,7 +3337,7 @@ Developed by MStefa003
                 report += f"Base Frequency: {cpu_freq.current:.2f} MHz\n"
                 report += f"Max Frequency: {cpu_freq.max:.2f} MHz\n"
             
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._current_cpu_percent()
             report += f"Current Usage: {cpu_percent:.1f}%\n\n"
             
             # Memory Information
@@ -2794,20 +3356,15 @@ Developed by MStefa003
             report += "DISK INFORMATION:\n"
             report += "-" * 30 + "\n"
             
-            partitions = psutil.disk_partitions()
-            for partition in partitions:
-                if 'cdrom' in partition.opts or partition.fstype == '':
-                    continue
-                    
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    report += f"Drive {partition.device}:\n"
-                    report += f"  File System: {partition.fstype}\n"
-                    report += f"  Total: {usage.total / (1024**3):.2f} GB\n"
-                    report += f"  Used: {usage.used / (1024**3):.2f} GB ({(usage.used/usage.total)*100:.1f}%)\n"
-                    report += f"  Free: {usage.free / (1024**3):.2f} GB\n\n"
-                except (PermissionError, FileNotFoundError):
+            for partition, usage in _partition_usages(_get_partitions()):
+                if usage is None:
                     report += f"Drive {partition.device}: Access Denied\n\n"
+                    continue
+                report += f"Drive {partition.device}:\n"
+                report += f"  File System: {partition.fstype}\n"
+                report += f"  Total: {usage.total / (1024**3):.2f} GB\n"
+                report += f"  Used: {usage.used / (1024**3):.2f} GB ({(usage.used/usage.total)*100:.1f}%)\n"
+                report += f"  Free: {usage.free / (1024**3):.2f} GB\n\n"
             
             # Network Information
             report += "NETWORK INFORMATION:\n"
@@ -2822,15 +3379,15 @@ Developed by MStefa003
             # Process Information
             report += "PROCESS INFORMATION:\n"
             report += "-" * 30 + "\n"
-            report += f"Total Processes: {len(psutil.pids())}\n"
             
-            # Get top 5 processes by CPU
+            # Get top 5 processes by CPU; the same walk gives the total
             processes = []
             for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
                 try:
                     processes.append(proc.info)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
+            report += f"Total Processes: {len(processes)}\n"
             
             processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
             report += "\nTop 5 Processes by CPU Usage:\n"
@@ -2855,15 +3412,8 @@ Developed by MStefa003
             text_edit = QTextEdit()
             text_edit.setPlainText(report)
             text_edit.setReadOnly(True)
-            text_edit.setFont(QFont("Consolas", 9))
-            text_edit.setStyleSheet("""
-                QTextEdit {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
+            text_edit.setFont(self._mono_font)
+            text_edit.setStyleSheet(self._TEXTEDIT_QSS)
             layout.addWidget(text_edit)
             
             # Button layout
@@ -3317,8 +3867,8 @@ Developed by MStefa003
         self.scan_thread = DuplicateScanThread(
             self.duplicate_finder, scan_path, extensions, min_size
         )
-        self.scan_thread.progress_updated.connect(self.update_scan_progress)
-        self.scan_thread.scan_completed.connect(self._on_scan_completed)
+        self.scan_thread.progress_updated.connect(self.update_scan_progress, Qt.QueuedConnection)
+        self.scan_thread.scan_completed.connect(self._on_scan_completed, Qt.QueuedConnection)
         self.scan_thread.finished.connect(lambda: setattr(self, 'scan_thread', None))  # Clean up reference
         self.scan_thread.start()
         
@@ -3344,7 +3894,7 @@ Developed by MStefa003
         if not duplicates:
             QMessageBox.information(self, "Scan Complete", 
                                   "No duplicate files found in the selected directory.")
-            self.log_activity("Duplicate scan completed - no duplicates found", "INFO")
+            self.log_activity("Duplicate scan completed - no duplicates found", "SUCCESS")
             return
         
         # Show results
@@ -3444,6 +3994,7 @@ Developed by MStefa003
         """)
         delete_btn.clicked.connect(self._delete_selected_duplicates)
         button_layout.addWidget(delete_btn)
+        self.delete_duplicates_btn = delete_btn
         
         self.results_layout.addLayout(button_layout)
         
@@ -3472,6 +4023,9 @@ Developed by MStefa003
     
     def _delete_selected_duplicates(self):
         """Delete selected duplicate files."""
+        if self.delete_thread is not None and self.delete_thread.isRunning():
+            return
+        
         selected_files = []
         
         # Collect selected files
@@ -3500,8 +4054,18 @@ Developed by MStefa003
         if reply != QMessageBox.Yes:
             return
         
-        # Delete files
-        result = self.duplicate_finder.delete_selected_duplicates(selected_files)
+        # Files are compared and deleted off the GUI thread
+        from duplicate_scan_thread import DuplicateDeleteThread
+        self.delete_duplicates_btn.setEnabled(False)
+        self.delete_duplicates_btn.setText("Deleting...")
+        self.delete_thread = DuplicateDeleteThread(self.duplicate_finder, selected_files)
+        self.delete_thread.deletion_completed.connect(self._on_deletion_completed, Qt.QueuedConnection)
+        self.delete_thread.start()
+    
+    def _on_deletion_completed(self, selected_files, result):
+        """Show the deletion result and drop the deleted files from the tree."""
+        self.delete_duplicates_btn.setEnabled(True)
+        self.delete_duplicates_btn.setText("🗑️ Delete Selected")
         
         # Show results
         if result['deleted_files'] > 0:
@@ -3539,7 +4103,6 @@ Developed by MStefa003
     
     def save_report(self, report_content):
         """Save system report to file."""
-        from datetime import datetime
         
         filename, _ = QFileDialog.getSaveFileName(
             self,
@@ -3578,10 +4141,24 @@ Developed by MStefa003
                 return
         
         # Clean shutdown
+        self.graphs_widget.stop_sampling()
+        self.main_timer.stop()
+        self._stats_thread.quit()
+        self._stats_thread.wait()
+        if self._process_thread is not None:
+            self._process_thread.quit()
+            self._process_thread.wait()
         if self.cleanup_worker and self.cleanup_worker.isRunning():
             self.cleanup_worker.terminate()
             self.cleanup_worker.wait()
         
+        if self.security_scan_worker and self.security_scan_worker.isRunning():
+            self.security_scan_worker.wait()
+        for worker in [self.disk_analysis_worker, *self._detached_disk_workers]:
+            if worker and worker.isRunning():
+                worker.cancel()
+                worker.wait()
+        
         self.log_activity("Application closing")
         event.accept()
     
@@ -3675,7 +4252,7 @@ Developed by MStefa003
             
             self.results_text = QTextEdit()
             self.results_text.setReadOnly(True)
-            self.results_text.setFont(QFont("Consolas", 9))
+            self.results_text.setFont(self._mono_font)
             self.results_text.setMinimumHeight(300)
             results_layout.addWidget(self.results_text)
             
@@ -3822,7 +4399,7 @@ Developed by MStefa003
             f"Performance benchmark completed!\n\nOverall Score: {overall_score}\nRating: {rating}"
         )
         
-        self.log_activity(f"Performance benchmark completed - Score: {overall_score}, Rating: {rating}")
+        self.log_activity(f"Performance benchmark completed - Score: {overall_score}, Rating: {rating}", "SUCCESS")
     
     def benchmark_error(self, error_msg):
         """Handle benchmark error."""
@@ -3840,7 +4417,6 @@ Developed by MStefa003
             return
         
         try:
-            from datetime import datetime
             from performance_benchmark import BenchmarkExporter
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
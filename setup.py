@@ -56,6 +56,10 @@ setup(
         "build": [
             "pyinstaller>=6.0.0",
         ],
+        "fast": [
+            "blake3>=0.3.1",
+            "xxhash>=2.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [